@@ -3,11 +3,10 @@
 Provides shared agent creation logic for different entrypoints (CLI, MCP server, etc.).
 """
 import argparse
+import inspect
 from pathlib import Path
 
 from agent.config import AgentConfig, FilesystemSource
-from agent.config.sources.postgres import PostgresSource
-from agent.observability import configure_langsmith
 from agent.core import AgentFactory, Agent
 
 
@@ -30,13 +29,19 @@ async def create_agent_from_args(args: argparse.Namespace) -> Agent:
             raise ValueError("--postgres-dsn required when using postgres source")
         if not args.agent_name:
             raise ValueError("--agent-name required when using postgres source")
+        from agent.config.sources.postgres import PostgresSource
         source = PostgresSource(args.postgres_dsn, args.agent_name)
     else:
         raise ValueError(f"Unsupported source type: {args.source_type}")
     
-    config_data = source.load(no_mcp=args.no_mcp)
+    load_async = getattr(source, "load_async", None)
+    if inspect.iscoroutinefunction(load_async):
+        config_data = await load_async(no_mcp=args.no_mcp)
+    else:
+        config_data = source.load(no_mcp=args.no_mcp)
     config = AgentConfig.from_dict(config_data)
     
+    from agent.observability import configure_langsmith
     configure_langsmith(config.name)
     
     return await AgentFactory.create(config)
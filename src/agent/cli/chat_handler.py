@@ -2,10 +2,33 @@
 
 Handles interactive chat sessions and single-query execution for the CLI interface.
 """
+import asyncio
+import itertools
+import sys
 import time
 from typing import AsyncGenerator
 
-from agent.cli.ui import CLIInterface
+from agent.cli.ui import (
+    FlushingTokenBuffer,
+    get_input,
+    print_assistant_prefix,
+    print_error,
+    print_separator,
+    print_system,
+    print_user_prompt,
+)
+
+# Wall-clock base so IDs stay unique across runs (threads may be persisted),
+# plus a counter so IDs created within the same process never collide.
+_BASE_NS = time.time_ns()
+_COUNTER = itertools.count()
+
+_EXIT_CMDS = frozenset({"exit", "quit"})
+
+
+def _new_thread_id() -> str:
+    """Generate a unique session thread ID."""
+    return f"session-{_BASE_NS + next(_COUNTER)}"
 
 
 class CLIChatHandler:
@@ -27,54 +50,109 @@ class CLIChatHandler:
             thread_id: Optional thread ID for conversation continuity.
         """
         if not thread_id:
-            thread_id = f"session-{int(time.time())}"
+            thread_id = _new_thread_id()
 
-        CLIInterface.print_separator()
-        CLIInterface.print_system(
+        print_separator()
+        print_system(
             f"Started session with {self.agent.config.name} on thread ID: {thread_id}"
         )
-        CLIInterface.print_system("Type 'exit' or 'quit' to end the conversation")
-        CLIInterface.print_system("Type 'new' to start a new conversation thread")
-        CLIInterface.print_separator()
+        print_system("Type 'exit' or 'quit' to end the conversation")
+        print_system("Type 'new' to start a new conversation thread")
+        print_separator()
 
-        single_query_mode = query is not None
+        buf = FlushingTokenBuffer(sys.stdout, max_bytes=64, flush_on="\n")
+
+        if query:
+            try:
+                print()
+                print_user_prompt()
+                print(query)
+                await self._handle_one_turn(query, thread_id, buf)
+            except KeyboardInterrupt:
+                print_system("\n\nGoodbye!")
+            except Exception as e:  # noqa: BLE001
+                print_error(f"\nError: {e}")
+            return
 
         while True:
             try:
                 print()
-                CLIInterface.print_user_prompt()
-                if query:
-                    user_input = query
-                    query = None  # Clear query after first use
-                    print(user_input)
-                else:
-                    user_input = CLIInterface.get_input()
-                    print()
-
-                if user_input.lower() in ["exit", "quit"]:
-                    CLIInterface.print_system("Goodbye!")
+                print_user_prompt()
+                user_input = await get_input()
+                print()
+
+                cmd = user_input.strip().lower()
+                if not cmd:
+                    continue
+
+                if cmd in _EXIT_CMDS:
+                    print_system("Goodbye!")
                     break
 
-                if user_input.lower() == "new":
-                    thread_id = f"session-{int(time.time())}"
-                    CLIInterface.print_system(
+                if cmd == "new":
+                    thread_id = _new_thread_id()
+                    print_system(
                         f"Started new session with {self.agent.config.name} on thread ID: {thread_id}"
                     )
                     continue
 
-                if not user_input.strip():
-                    continue
-
-                CLIInterface.print_assistant_prefix()
-
-                async for token in self.agent.stream(user_input, thread_id):
-                    CLIInterface.print_chunk(token)
-
-                if single_query_mode:
-                    break
+                await self._handle_one_turn(user_input, thread_id, buf)
 
             except KeyboardInterrupt:
-                CLIInterface.print_system("\n\nGoodbye!")
+                print_system("\n\nGoodbye!")
                 break
             except Exception as e:  # noqa: BLE001
-                CLIInterface.print_error(f"\nError: {e}")
+                print_error(f"\nError: {e}")
+
+    async def _handle_one_turn(
+        self, user_input: str, thread_id: str, buf: FlushingTokenBuffer
+    ) -> None:
+        """Send one message to the agent and stream the reply.
+
+        Args:
+            user_input: Message to send to the agent
+            thread_id: Thread ID for conversation continuity
+            buf: Token buffer to write the response to
+        """
+        print_assistant_prefix()
+        await self._stream_response(user_input, thread_id, buf)
+
+    async def _stream_response(
+        self, user_input: str, thread_id: str, buf: FlushingTokenBuffer
+    ) -> None:
+        """Stream the agent response into the output buffer.
+
+        The agent stream is drained by a producer task into a bounded queue
+        so it can keep reading while the consumer writes to the terminal.
+
+        Args:
+            user_input: Message to send to the agent
+            thread_id: Thread ID for conversation continuity
+            buf: Token buffer to write the response to
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+        async def produce() -> None:
+            async for token in self.agent.stream(user_input, thread_id):
+                await queue.put(token)
+            await queue.put(None)
+
+        async def consume() -> None:
+            while True:
+                if queue.empty():
+                    # Nothing else is ready (e.g. a tool call is running), so
+                    # show the partial text instead of holding it while we wait
+                    buf.flush()
+                token = await queue.get()
+                if token is None:
+                    break
+                buf.write(token)
+
+        producer = asyncio.create_task(produce())
+        consumer = asyncio.create_task(consume())
+        try:
+            await asyncio.gather(producer, consumer)
+        finally:
+            producer.cancel()
+            consumer.cancel()
+            buf.flush()
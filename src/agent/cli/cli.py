@@ -4,8 +4,7 @@ Provides `main` and `parse_args` for tests and tooling.
 """
 import argparse
 import asyncio
-
-from dotenv import load_dotenv
+import sys
 
 from agent.bootstrap import create_agent_from_args
 from agent.cli.chat_handler import CLIChatHandler
@@ -13,6 +12,8 @@ from agent.cli.chat_handler import CLIChatHandler
 
 async def main() -> None:
     """Main async entrypoint for the agent CLI."""
+    from dotenv import load_dotenv
+
     load_dotenv()
     args = parse_args()
 
@@ -27,8 +28,35 @@ async def main() -> None:
         exit(1)
 
 
+# Defaults for the flagless fast path; must match _build_parser().
+_DEFAULT_ARGS = {
+    "config_base_path": "config",
+    "source_type": "filesystem",
+    "postgres_dsn": None,
+    "agent_name": None,
+    "mcp_dir": "config/mcp_servers",
+    "interactive": False,
+    "trace": False,
+    "thread_id": None,
+    "no_mcp": False,
+}
+
+
 def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
+    """Parse command-line arguments.
+
+    The common invocations (no arguments, or a single query with no flags)
+    are handled without building an ArgumentParser.
+    """
+    argv = sys.argv[1:]
+    if len(argv) <= 1 and not any(a.startswith("-") for a in argv):
+        return argparse.Namespace(query=argv[0] if argv else None, **_DEFAULT_ARGS)
+
+    return _build_parser().parse_args(argv)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="SimpleAgent - A ReAct agent with MCP tools",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -120,8 +148,13 @@ Examples:
         help="Run without loading MCP servers",
     )
 
-    return parser.parse_args()
+    return parser
 
 
 if __name__ == "__main__":  # pragma: no cover
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional dependency
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,3 +1,10 @@
+import asyncio
+import sys
+import threading
+import time
+from typing import TextIO
+
+
 class Colors:
     USER = "\033[96m"
     ASSISTANT = "\033[92m"
@@ -5,34 +12,130 @@ class Colors:
     ERROR = "\033[91m"
     RESET = "\033[0m"
 
+
+_SYSTEM_PREFIX = Colors.SYSTEM
+_ERROR_PREFIX = Colors.ERROR
+_LINE_END = Colors.RESET + "\n"
+_USER_PROMPT = "\n" + Colors.USER + "You: " + Colors.RESET
+_ASSISTANT_PREFIX = Colors.ASSISTANT + "Assistant: " + Colors.RESET
+_SEPARATOR_LINE = Colors.SYSTEM + "-" * 32 + Colors.RESET + "\n"
+
+
+class FlushingTokenBuffer:
+    """Accumulates streamed tokens and writes them out at boundaries.
+
+    Tokens are encoded into a bytearray and written to the stream only
+    when a flush character is seen, the buffer reaches ``max_bytes``
+    encoded bytes, or ``max_delay`` seconds have passed since the last
+    flush. The delay is only checked on write, so a consumer that waits
+    for more tokens must call flush() before blocking. When the stream
+    exposes a binary ``buffer`` the bytes are written there directly,
+    bypassing the text encoder.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        max_bytes: int = 64,
+        flush_on: str = "\n",
+        max_delay: float = 0.05,
+    ):
+        self._stream = stream
+        self._raw = getattr(stream, "buffer", None)
+        self._encoding = getattr(stream, "encoding", None) or "utf-8"
+        self._errors = getattr(stream, "errors", None) or "strict"
+        self._max_bytes = max_bytes
+        self._flush_on = flush_on
+        self._max_delay = max_delay
+        self._buf = bytearray()
+        self._last_flush = time.monotonic()
+
+    def write(self, chunk: str):
+        if not chunk:
+            return
+        self._buf += chunk.encode(self._encoding, self._errors)
+        if (
+            len(self._buf) >= self._max_bytes
+            or self._flush_on in chunk
+            or time.monotonic() - self._last_flush >= self._max_delay
+        ):
+            self.flush()
+
+    def flush(self):
+        if self._buf:
+            if self._raw is not None:
+                # Drain pending text first so output order is preserved
+                self._stream.flush()
+                self._raw.write(self._buf)
+                self._raw.flush()
+            else:
+                print_chunk(self._buf.decode(self._encoding, self._errors), self._stream)
+            self._buf.clear()
+        self._last_flush = time.monotonic()
+
+
+def print_system(message: str):
+    sys.stdout.write(_SYSTEM_PREFIX + message + _LINE_END)
+
+
+def print_error(message: str):
+    sys.stdout.write(_ERROR_PREFIX + message + _LINE_END)
+
+
+def print_user_prompt():
+    sys.stdout.write(_USER_PROMPT)
+
+
+async def get_input() -> str:
+    """Read a line without blocking the event loop.
+
+    The blocking input() call runs on a daemon thread so an interrupted
+    session can exit without waiting for the user to press Enter.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+
+    def read_line():
+        try:
+            line = input()
+        except BaseException as e:  # noqa: BLE001 - forwarded to the awaiting task
+            loop.call_soon_threadsafe(settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(settle, future.set_result, line)
+
+    threading.Thread(target=read_line, daemon=True).start()
+    return await future
+
+
+def print_assistant_prefix():
+    sys.stdout.write(_ASSISTANT_PREFIX)
+    sys.stdout.flush()
+
+
+def print_chunk(chunk_content: str, stream: TextIO | None = None):
+    stream = stream or sys.stdout
+    stream.write(chunk_content)
+    stream.flush()
+
+
+def print_separator():
+    sys.stdout.write(_SEPARATOR_LINE)
+
+
 class CLIInterface:
-    """Handles CLI input and output with formatting."""
-    
-    @staticmethod
-    def print_system(message: str):
-        print(f"{Colors.SYSTEM}{message}{Colors.RESET}")
-        
-    @staticmethod
-    def print_error(message: str):
-        print(f"{Colors.ERROR}{message}{Colors.RESET}")
-        
-    @staticmethod
-    def print_user_prompt():
-        print(f"\n{Colors.USER}You: {Colors.RESET}", end="")
-        
-    @staticmethod
-    def get_input() -> str:
-        return input()
-        
-    @staticmethod
-    def print_assistant_prefix():
-        print(f"{Colors.ASSISTANT}Assistant: {Colors.RESET}", end="", flush=True)
-        
-    @staticmethod
-    def print_chunk(chunk_content: str):
-        print(chunk_content, end="", flush=True)
-        
-    @staticmethod
-    def print_separator():
-        print(f"{Colors.SYSTEM}--------------------------------{Colors.RESET}")
+    """Handles CLI input and output with formatting.
+
+    Kept for backward compatibility; prefer the module-level functions.
+    """
 
+    print_system = staticmethod(print_system)
+    print_error = staticmethod(print_error)
+    print_user_prompt = staticmethod(print_user_prompt)
+    get_input = staticmethod(get_input)
+    print_assistant_prefix = staticmethod(print_assistant_prefix)
+    print_chunk = staticmethod(print_chunk)
+    print_separator = staticmethod(print_separator)
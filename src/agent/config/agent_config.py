@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for an AI agent.
 
@@ -32,21 +32,15 @@ class AgentConfig:
         Returns:
             AgentConfig instance
         """
-        agent_name = config_data.get("name", "simple-agent")
-        model_data = config_data.get("model", {})
-        model_name = model_data.get("name", "gpt-4")
-        temperature = model_data.get("temperature", 0)
-        system_prompt = config_data.get("prompt", "You are a helpful assistant.")
-        tool_configs = config_data.get("tools", [])
-        checkpointer_config = config_data.get("checkpointer")
-        middleware_configs = config_data.get("middleware", [])
+        get = config_data.get
+        model_data = get("model", {})
 
         return cls(
-            name=agent_name,
-            model_name=model_name,
-            temperature=temperature,
-            system_prompt=system_prompt,
-            tool_configs=tool_configs,
-            checkpointer_config=checkpointer_config,
-            middleware_configs=middleware_configs,
+            name=get("name", "simple-agent"),
+            model_name=model_data.get("name", "gpt-4"),
+            temperature=model_data.get("temperature", 0),
+            system_prompt=get("prompt", "You are a helpful assistant."),
+            tool_configs=get("tools", []),
+            checkpointer_config=get("checkpointer"),
+            middleware_configs=get("middleware", []),
         )
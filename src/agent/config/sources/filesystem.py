@@ -4,10 +4,85 @@ Loads configuration from JSON files in a directory structure:
     config/
         agent.json          (required)
         mcp_servers.json    (optional)
+
+Uses orjson for parsing when it is installed, falling back to the
+standard library json module otherwise. With orjson, large files are
+parsed straight from a read-only mmap instead of a heap copy.
 """
-import json
+import asyncio
+import copy
+import functools
+import mmap
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _MMAP_MIN_SIZE = 64 * 1024
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+    _loads = json.loads
+    # stdlib json cannot parse from a buffer, so mmap would only add a copy
+    _MMAP_MIN_SIZE = None
+
+# (st_mtime_ns, st_size): cheap signal that a file has changed
+Stamp = Tuple[int, int]
+
+_MCP_TOOL_TEMPLATE = {"type": "mcp", "enabled": True, "servers": None}
+
+
+@functools.lru_cache(maxsize=32)
+def _read_json(path: str, stamp: Stamp) -> Any:
+    """Parse a JSON file.
+
+    The file's modification time and size are part of the cache key, so
+    editing the file invalidates the cached entry, even on filesystems
+    with coarse timestamps. Callers must not mutate the result.
+    """
+    with open(path, "rb") as f:
+        if _MMAP_MIN_SIZE is not None and os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return _loads(view)
+        return _loads(f.read())
+
+
+@functools.lru_cache(maxsize=16)
+def _load_config(
+    agent_path: str,
+    agent_stamp: Stamp,
+    mcp_path: str,
+    mcp_stamp: Optional[Stamp],
+    no_mcp: bool,
+) -> Dict[str, Any]:
+    """Assemble configuration, injecting MCP tools if needed.
+
+    Memoized on both files' stamps (mtime and size). The result is shared
+    between callers, who must copy it before handing it out.
+    """
+    agent_data = _read_json(agent_path, agent_stamp)
+
+    if "tools" in agent_data or no_mcp or mcp_stamp is None:
+        return agent_data
+
+    # Shallow copy so the cached parse of agent.json is left untouched
+    config = dict(agent_data)
+    tool = _MCP_TOOL_TEMPLATE.copy()
+    tool["servers"] = _read_json(mcp_path, mcp_stamp)
+    config["tools"] = [tool]
+
+    return config
+
+
+def _stamp(path: str) -> Optional[Stamp]:
+    """Return the (mtime_ns, size) staleness signal for path, or None if missing."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
 class FilesystemSource:
@@ -17,6 +92,8 @@ class FilesystemSource:
     containing agent.json and optionally mcp_servers.json.
     
     Handles MCP tool injection if no tools are explicitly defined.
+    Parsing is memoized and invalidated when either file's modification
+    time or size changes; each call returns its own deep copy.
     
     Args:
         base_path: Directory containing configuration files
@@ -33,6 +110,17 @@ class FilesystemSource:
             base_path: Directory containing agent.json and optional mcp_servers.json
         """
         self.base_path = base_path
+        self._agent_path = str(base_path / "agent.json")
+        self._mcp_path = str(base_path / "mcp_servers.json")
+    
+    def _agent_stamp(self) -> Stamp:
+        """Stat agent.json, reporting which part of the path is missing."""
+        stamp = _stamp(self._agent_path)
+        if stamp is None:
+            if not os.path.isdir(self.base_path):
+                raise FileNotFoundError(f"Config directory does not exist: {self.base_path}")
+            raise FileNotFoundError(f"Required agent config not found: {self._agent_path}")
+        return stamp
     
     def load(self, no_mcp: bool = False) -> Dict[str, Any]:
         """Load complete agent configuration with MCP tool injection if needed.
@@ -52,38 +140,45 @@ class FilesystemSource:
         Raises:
             FileNotFoundError: If base_path or agent.json doesn't exist
             json.JSONDecodeError: If JSON files are malformed
+                (orjson.JSONDecodeError subclasses it when orjson is used)
         """
-        if not self.base_path.exists():
-            raise FileNotFoundError(f"Config directory does not exist: {self.base_path}")
-        
-        agent_file = self.base_path / "agent.json"
-        if not agent_file.exists():
-            raise FileNotFoundError(f"Required agent config not found: {agent_file}")
-        
-        with open(agent_file) as f:
-            agent_data = json.load(f)
-        
-        if "tools" in agent_data:
-            return agent_data
+        agent_stamp = self._agent_stamp()
+        mcp_stamp = None if no_mcp else _stamp(self._mcp_path)
+        return self._assemble(agent_stamp, mcp_stamp, no_mcp)
+    
+    async def load_async(self, no_mcp: bool = False) -> Dict[str, Any]:
+        """Load configuration, reading both JSON files concurrently.
         
-        if no_mcp:
-            print("Running without MCP servers (--no-mcp flag used)")
-            return agent_data
+        Same rules and errors as load(); the file reads run in worker
+        threads so their latency overlaps.
         
-        mcp_file = self.base_path / "mcp_servers.json"
-        if not mcp_file.exists():
-            print("No MCP servers config file found, proceeding without MCP tools.")
-            return agent_data
+        Args:
+            no_mcp: If True, prevent MCP tool injection
         
-        with open(mcp_file) as f:
-            mcp_servers = json.load(f)
+        Returns:
+            Complete agent configuration dictionary
+        """
+        agent_stamp = self._agent_stamp()
+        mcp_stamp = None if no_mcp else _stamp(self._mcp_path)
         
-        agent_data["tools"] = [
-            {
-                "type": "mcp",
-                "enabled": True,
-                "servers": mcp_servers
-            }
-        ]
+        reads = [asyncio.to_thread(_read_json, self._agent_path, agent_stamp)]
+        if mcp_stamp is not None:
+            reads.append(asyncio.to_thread(_read_json, self._mcp_path, mcp_stamp))
+        await asyncio.gather(*reads)
         
-        return agent_data
+        # Both parses are now cached, so assembly does no further I/O
+        return self._assemble(agent_stamp, mcp_stamp, no_mcp)
+    
+    def _assemble(
+        self, agent_stamp: Stamp, mcp_stamp: Optional[Stamp], no_mcp: bool
+    ) -> Dict[str, Any]:
+        """Copy the memoized config, reporting on every load why MCP tools were skipped."""
+        config = _load_config(
+            self._agent_path, agent_stamp, self._mcp_path, mcp_stamp, no_mcp
+        )
+        if "tools" not in config:
+            if no_mcp:
+                print("Running without MCP servers (--no-mcp flag used)")
+            else:
+                print("No MCP servers config file found, proceeding without MCP tools.")
+        return copy.deepcopy(config)
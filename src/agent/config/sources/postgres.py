@@ -11,17 +11,168 @@ Loads configuration from PostgreSQL database tables via tool_catalog view:
 Requires psycopg2 or psycopg (add to requirements.txt):
     psycopg2-binary>=2.9.0
 """
-import json
+import asyncio
+import copy
+import os
 import sys
-from typing import Any, Dict, Optional
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 from uuid import UUID
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+    _loads = json.loads
+
+_AGENT_CFG_HEAD = """
+WITH agent_data AS MATERIALIZED (
+    SELECT 
+        a.id as agent_id,
+        a.name,
+        a.description,
+        av.id as version_id,
+        av.version,
+        av.model_name,
+        av.model_temperature,
+        av.prompt,
+        av.schema_version
+    FROM agents a
+    JOIN agent_versions av ON a.id = av.agent_id
+    WHERE a.name = $1 AND av.is_active = TRUE
+    LIMIT 1
+)
+SELECT 
+    ad.agent_id,
+    ad.name,
+    ad.description,
+    ad.version_id,
+    ad.version,
+    ad.model_name,
+    ad.model_temperature,
+    ad.prompt,
+    ad.schema_version,
+    COALESCE(
+        (
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'type', avm.middleware_type,
+                    'enabled', avm.enabled
+                ) || CASE
+                    WHEN avm.config IS NULL
+                      OR avm.config::jsonb IN ('{}'::jsonb, 'null'::jsonb)
+                    THEN '{}'::jsonb
+                    ELSE jsonb_build_object('config', avm.config)
+                END
+                ORDER BY avm.execution_order
+            )
+            FROM agent_version_middlewares avm
+            WHERE avm.agent_version_id = ad.version_id
+              AND avm.enabled = TRUE
+        ),
+        '[]'::jsonb
+    ) as middlewares,
+"""
+
+# Skipped entirely when MCP tools are disabled
+_AGENT_CFG_TOOLS = """
+    COALESCE(
+        (
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'tool_kind', tc.tool_kind,
+                    'tool_id', avt.tool_id,
+                    'tool_name', tc.tool_name,
+                    'enabled', avt.enabled,
+                    'priority', avt.priority,
+                    'transport', COALESCE(
+                        avt.override->>'transport',
+                        tc.transport
+                    ),
+                    'command', COALESCE(
+                        avt.override->>'command',
+                        tc.command
+                    ),
+                    'args', COALESCE(
+                        avt.override->'args',
+                        tc.args
+                    ),
+                    'env', COALESCE(
+                        avt.override->'env',
+                        tc.env
+                    ),
+                    'endpoint_url', ai.endpoint_url
+                )
+                ORDER BY avt.priority
+            )
+            FROM agent_version_tools avt
+            JOIN tool_catalog tc ON avt.tool_id = tc.tool_id
+            LEFT JOIN LATERAL (
+                SELECT ai.endpoint_url
+                FROM agent_instances ai
+                JOIN agents a2 ON ai.agent_id = a2.id
+                WHERE a2.name = tc.tool_name
+                  AND ai.last_heartbeat > NOW() - INTERVAL '20 minutes'
+                ORDER BY ai.last_heartbeat DESC
+                LIMIT 1
+            ) ai ON tc.tool_kind = 'agent'
+            WHERE avt.agent_version_id = ad.version_id
+              AND avt.enabled = TRUE
+              AND tc.enabled = TRUE
+        ),
+        '[]'::jsonb
+    )
+"""
+
+
+def _agent_cfg_statements(name: str, tools_sql: str) -> tuple:
+    """Build the (name, PREPARE, EXECUTE) statements for one query variant."""
+    prepare = (
+        f"PREPARE {name} (text) AS\n"
+        + _AGENT_CFG_HEAD
+        + tools_sql
+        + " as tools\nFROM agent_data ad\n"
+    )
+    return name, prepare, f"EXECUTE {name}(%s)"
+
+
+# Prepared once per pooled connection so the planner work is not
+# repeated on every load. Keyed by no_mcp.
+_AGENT_CFG_STATEMENTS = {
+    False: _agent_cfg_statements("agent_cfg", _AGENT_CFG_TOOLS),
+    True: _agent_cfg_statements("agent_cfg_nomcp", "NULL"),
+}
+
+# SQLSTATE raised by EXECUTE when a schema change alters the result type of
+# a prepared statement ("cached plan must not change result type")
+_CACHED_PLAN_CHANGED = "0A000"
+
+
+_PY_EXECUTABLE = sys.executable
+
+# Spawns a stdio MCP server for an agent tool; followed by the DSN,
+# "--agent-name" and the tool name.
+_DEFAULT_STDIO_ARGS_PREFIX = ("-m", "agent.mcp.server", "--source-type", "postgres", "--postgres-dsn")
+
+
+def _resolve_cmd(command: Optional[str]) -> Optional[str]:
+    """Resolve the "python" keyword to the running interpreter for venv compatibility."""
+    return _PY_EXECUTABLE if command == "python" else command
+
 
 class PostgresSource:
     """Load configuration from PostgreSQL database.
     
     This source reads agent configuration from a PostgreSQL database,
     including LLM settings, tools, middlewares, and MCP server configurations.
+    Connections are borrowed from a process-wide pool shared by every
+    source using the same DSN. Assembled configs are cached per DSN and
+    agent for AGENT_CFG_TTL seconds (default 60), or at most 30 seconds
+    when they reference agent tools whose endpoints may change.
     
     Database Schema:
         agents - Agent metadata (name, description)
@@ -41,6 +192,16 @@ class PostgresSource:
         >>> config_data = source.load(no_mcp=False)
     """
     
+    _POOLS: Dict[str, Any] = {}
+    _POOLS_LOCK = threading.Lock()
+    
+    _CACHE: Dict[tuple, tuple] = {}
+    _CACHE_TTL = float(os.getenv("AGENT_CFG_TTL", "60"))
+    _ENDPOINT_TTL = 30.0
+    
+    # Names of the statements prepared on each pooled connection
+    _PREPARED: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    
     def __init__(self, connection_string: str, agent_name: str):
         """Initialize repository with database connection.
         
@@ -50,32 +211,58 @@ class PostgresSource:
         """
         self.connection_string = connection_string
         self.agent_name = agent_name
-        self._conn = None
     
-    def _connect(self):
-        """Lazy connection initialization."""
-        if self._conn is None:
-            try:
-                import psycopg2
-                from psycopg2.extras import RealDictCursor
-                self._conn = psycopg2.connect(
-                    self.connection_string,
+    @classmethod
+    def _get_pool(cls, dsn: str):
+        """Return the shared connection pool for a DSN, creating it on first use."""
+        pool = cls._POOLS.get(dsn)
+        if pool is not None:
+            return pool
+        
+        with cls._POOLS_LOCK:
+            pool = cls._POOLS.get(dsn)
+            if pool is None:
+                try:
+                    from psycopg2 import pool as pg_pool
+                    from psycopg2.extras import (
+                        RealDictCursor,
+                        register_default_json,
+                        register_default_jsonb,
+                    )
+                except ImportError:
+                    raise ImportError(
+                        "psycopg2 is required for PostgresSource. "
+                        "Install with: pip install psycopg2-binary"
+                    )
+                # Decode json/jsonb columns with orjson when available
+                register_default_json(globally=True, loads=_loads)
+                register_default_jsonb(globally=True, loads=_loads)
+                pool = pg_pool.ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=16,
+                    dsn=dsn,
                     cursor_factory=RealDictCursor
                 )
-            except ImportError:
-                raise ImportError(
-                    "psycopg2 is required for PostgresSource. "
-                    "Install with: pip install psycopg2-binary"
-                )
-        return self._conn
+                cls._POOLS[dsn] = pool
+        return pool
     
-    def _close(self):
-        """Close database connection."""
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+    @contextmanager
+    def _cursor(self) -> Iterator[Any]:
+        """Borrow a pooled connection and yield a cursor on it.
+        
+        Config loads only read, so the connection runs in autocommit mode
+        to avoid the BEGIN/COMMIT round trips. The connection is always
+        returned to the pool.
+        """
+        pool = self._get_pool(self.connection_string)
+        conn = pool.getconn()
+        try:
+            conn.autocommit = True
+            yield conn.cursor()
+        finally:
+            pool.putconn(conn)
     
-    def load(self, no_mcp: bool = False) -> Dict[str, Any]:
+    def load(self, no_mcp: bool = False, refresh: bool = False) -> Dict[str, Any]:
         """Load complete agent configuration from PostgreSQL.
         
         Orchestrates the config assembly pipeline:
@@ -87,6 +274,7 @@ class PostgresSource:
         Args:
             no_mcp: If True, sets tools to empty list; otherwise loads 
                     tools from agent_version_tools with override support
+            refresh: If True, bypass the cache and query the database
         
         Returns:
             Complete agent configuration dictionary with tools always present
@@ -95,46 +283,70 @@ class PostgresSource:
         Raises:
             FileNotFoundError: If agent or active version not found
         """
-        try:
-            conn = self._connect()
-            cur = conn.cursor()
-            
-            agent_data = self._fetch_agent_data(cur)
-            
-            # Build sub-objects
-            name = agent_data["name"]
-            description = agent_data.get("description", "")
-            llm = self._build_llm(agent_data)
-            prompt = self._build_prompt(agent_data)
-            middlewares = self._build_middlewares(agent_data) or []
-            tools = [] if no_mcp else (self._build_tools(agent_data) or [])
-            
-            # Assemble final config
-            config = {
-                "name": name,
-                "description": description,
-                "llm": llm,
-                "middlewares": middlewares,
-                "tools": tools
-            }
-            
-            if prompt:
-                config["prompt"] = prompt
-            
-            return config
-            
-        finally:
-            self._close()
+        key = (self.connection_string, self.agent_name, no_mcp)
+        if not refresh:
+            cached = self._CACHE.get(key)
+            if cached is not None and time.monotonic() < cached[0]:
+                return copy.deepcopy(cached[1])
+        
+        with self._cursor() as cur:
+            agent_data = self._fetch_agent_data(cur, no_mcp)
+        
+        # Build sub-objects
+        name = agent_data["name"]
+        description = agent_data.get("description", "")
+        llm = self._build_llm(agent_data)
+        prompt = self._build_prompt(agent_data)
+        middlewares = self._build_middlewares(agent_data) or []
+        tools = [] if no_mcp else (self._build_tools(agent_data) or [])
+        
+        # Assemble final config
+        config = {
+            "name": name,
+            "description": description,
+            "llm": llm,
+            "middlewares": middlewares,
+            "tools": tools
+        }
+        
+        if prompt:
+            config["prompt"] = prompt
+        
+        ttl = self._CACHE_TTL
+        if not no_mcp and any(
+            t["tool_kind"] == "agent" for t in agent_data.get("tools") or []
+        ):
+            ttl = min(ttl, self._ENDPOINT_TTL)
+        self._CACHE[key] = (time.monotonic() + ttl, config)
+        
+        return copy.deepcopy(config)
     
-    def _fetch_agent_data(self, cur) -> Dict[str, Any]:
+    async def load_async(self, no_mcp: bool = False, refresh: bool = False) -> Dict[str, Any]:
+        """Load configuration without blocking the event loop.
+        
+        Runs load() in a worker thread so the database round trip overlaps
+        with other startup work. Same arguments, result, and errors as load().
+        """
+        return await asyncio.to_thread(self.load, no_mcp, refresh)
+    
+    def _fetch_agent_data(self, cur, no_mcp: bool = False) -> Dict[str, Any]:
         """Fetch agent, version, middlewares, and tools in a single query.
         
-        Uses CTEs with JSON aggregation to minimize database round trips.
+        Uses a CTE plus scalar JSON-aggregating subqueries to minimize
+        database round trips. Filters are applied in WHERE so disabled rows
+        never enter the aggregates.
         Leverages tool_catalog view for unified tool access (MCP + agents).
+        Agent tools carry the endpoint_url of their most recent healthy
+        instance (heartbeat within 20 minutes), or null if none is running.
         Applies filters for active version and enabled items at query level.
+        The query is run as a server-side prepared statement, created the
+        first time each pooled connection is used and re-prepared if a
+        schema change invalidates it. With no_mcp the tools subquery is
+        left out and tools is NULL.
         
         Args:
             cur: Database cursor
+            no_mcp: If True, skip fetching tools
         
         Returns:
             Dictionary with agent metadata, middlewares array, and tools array
@@ -143,90 +355,21 @@ class PostgresSource:
             FileNotFoundError: If agent not found or has no active version
         """
         # TODO: Use schema versioning to handle different config formats
-        cur.execute("""
-            WITH agent_data AS (
-                SELECT 
-                    a.id as agent_id,
-                    a.name,
-                    a.description,
-                    av.id as version_id,
-                    av.version,
-                    av.model_name,
-                    av.model_temperature,
-                    av.prompt,
-                    av.schema_version
-                FROM agents a
-                JOIN agent_versions av ON a.id = av.agent_id
-                WHERE a.name = %s AND av.is_active = TRUE
-                LIMIT 1
-            ),
-            middlewares_agg AS (
-                SELECT 
-                    ad.version_id,
-                    COALESCE(
-                        json_agg(
-                            json_build_object(
-                                'type', avm.middleware_type,
-                                'config', avm.config,
-                                'enabled', avm.enabled,
-                                'execution_order', avm.execution_order
-                            )
-                            ORDER BY avm.execution_order
-                        ) FILTER (WHERE avm.middleware_type IS NOT NULL),
-                        '[]'::json
-                    ) as middlewares
-                FROM agent_data ad
-                LEFT JOIN agent_version_middlewares avm 
-                    ON ad.version_id = avm.agent_version_id 
-                    AND avm.enabled = TRUE
-                GROUP BY ad.version_id
-            ),
-            tools_agg AS (
-                SELECT 
-                    ad.version_id,
-                    COALESCE(
-                        json_agg(
-                            json_build_object(
-                                'tool_kind', tc.tool_kind,
-                                'tool_id', avt.tool_id,
-                                'tool_name', tc.tool_name,
-                                'enabled', avt.enabled,
-                                'priority', avt.priority,
-                                'transport', COALESCE(
-                                    avt.override->>'transport',
-                                    tc.transport
-                                ),
-                                'command', COALESCE(
-                                    avt.override->>'command',
-                                    tc.command
-                                ),
-                                'args', COALESCE(
-                                    avt.override->'args',
-                                    tc.args
-                                ),
-                                'env', COALESCE(
-                                    avt.override->'env',
-                                    tc.env
-                                )
-                            )
-                            ORDER BY avt.priority
-                        ) FILTER (WHERE avt.tool_id IS NOT NULL AND avt.enabled = TRUE AND tc.enabled = TRUE),
-                        '[]'::json
-                    ) as tools
-                FROM agent_data ad
-                LEFT JOIN agent_version_tools avt ON ad.version_id = avt.agent_version_id
-                LEFT JOIN tool_catalog tc ON avt.tool_id = tc.tool_id
-                GROUP BY ad.version_id
-            )
-            SELECT 
-                ad.*,
-                ma.middlewares,
-                ta.tools
-            FROM agent_data ad
-            LEFT JOIN middlewares_agg ma ON ad.version_id = ma.version_id
-            LEFT JOIN tools_agg ta ON ad.version_id = ta.version_id
-        """, (self.agent_name,))
-        
+        name, prepare, execute = _AGENT_CFG_STATEMENTS[no_mcp]
+        prepared = self._PREPARED.setdefault(cur.connection, set())
+        if name not in prepared:
+            cur.execute(prepare)
+            prepared.add(name)
+        try:
+            cur.execute(execute, (self.agent_name,))
+        except Exception as e:
+            if getattr(e, "pgcode", None) != _CACHED_PLAN_CHANGED:
+                raise
+            # The tables changed under the prepared plan; the connection is in
+            # autocommit mode, so it is still usable for preparing it again
+            cur.execute(f"DEALLOCATE {name}")
+            cur.execute(prepare)
+            cur.execute(execute, (self.agent_name,))
         result = cur.fetchone()
         if not result:
             raise FileNotFoundError(
@@ -261,10 +404,11 @@ class PostgresSource:
         return agent_data.get("prompt")
     
     def _build_middlewares(self, agent_data: Dict[str, Any]) -> Optional[list]:
-        """Transform middleware data into config format.
+        """Return middleware configs as shaped by the query.
         
         Business Rule: Only enabled middlewares, ordered by execution_order.
-        The query pre-filters and pre-orders, this just transforms the shape.
+        The query pre-filters, pre-orders and omits empty configs, so each
+        entry already has its final {"type", "enabled"[, "config"]} shape.
         
         Args:
             agent_data: Raw agent data containing middlewares array
@@ -272,18 +416,7 @@ class PostgresSource:
         Returns:
             List of middleware configs, or None if no middlewares
         """
-        middlewares = agent_data.get("middlewares", [])
-        if not middlewares:
-            return None
-        
-        return [
-            {
-                "type": m["type"],
-                "enabled": m["enabled"],
-                **({"config": m["config"]} if m["config"] else {})
-            }
-            for m in middlewares
-        ]
+        return agent_data.get("middlewares") or None
     
     def _build_tools(self, agent_data: Dict[str, Any]) -> Optional[list]:
         """Transform tool data into MCP servers config format.
@@ -293,7 +426,7 @@ class PostgresSource:
         IMPLEMENTED: Agent tools now default to HTTP transport instead of stdio
         
         For tool_kind='agent':
-        1. Queries agent_instances table to find running instance:
+        1. Reads the running instance resolved by _fetch_agent_data:
            - Looks up by agent name
            - Filters by heartbeat freshness (last 20 minutes)
            - Orders by most recent heartbeat
@@ -310,14 +443,14 @@ class PostgresSource:
         - More efficient than stdio (no process startup overhead)
         - Leverages existing heartbeat-based health tracking
         
-        SEE ALSO: _get_agent_instance_endpoint() method below
+        SEE ALSO: the LATERAL join on agent_instances in _fetch_agent_data()
         ================================================================
         
         Business Rules:
         - Only enabled tools from enabled servers (pre-filtered by query)
         - Respects agent_version_tools.override for command/args/transport/env
         - Groups multiple tools by server name into single MCP config
-        - For 'agent' tool_kind: queries agent_instances table to find running instance
+        - For 'agent' tool_kind: uses the running instance found via agent_instances
           and uses HTTP transport with endpoint URL (defaults to http if no instance found)
         - Special handling: "python" command is resolved to sys.executable for venv compatibility
         
@@ -331,62 +464,42 @@ class PostgresSource:
         if not tools_data:
             return None
         
+        stdio_args_prefix = (*_DEFAULT_STDIO_ARGS_PREFIX, self.connection_string, "--agent-name")
         servers = {}
         for tool in tools_data:
             tool_name = tool["tool_name"]
-            tool_kind = tool["tool_kind"]
+            transport = tool["transport"]
+            args = tool["args"]
+            env = tool["env"]
         
-            if tool_kind == "agent":
-                # Query agent_instances to find a running instance
-                endpoint_url = self._get_agent_instance_endpoint(tool_name)
+            if tool["tool_kind"] == "agent":
+                # Resolved from agent_instances by the main query
+                endpoint_url = tool.get("endpoint_url")
                 
                 if endpoint_url:
                     # Use HTTP transport with endpoint from agent_instances
                     server_config = {
-                        "transport": tool["transport"] or "http",
+                        "transport": transport or "http",
                         "url": endpoint_url
                     }
-                    
                     # HTTP transport doesn't need command/args
-                    if tool["env"]:
-                        server_config["env"] = tool["env"]
                 else:
                     # Fallback to stdio if no running instance found
-                    command = tool["command"] or sys.executable
-                    if command == "python":
-                        command = sys.executable
-                    
                     server_config = {
                         "transport": "stdio",
-                        "command": command
+                        "command": _resolve_cmd(tool["command"]) or _PY_EXECUTABLE,
+                        "args": args or [*stdio_args_prefix, tool_name]
                     }
-                    
-                    if tool["args"]:
-                        server_config["args"] = tool["args"]
-                    else:
-                        server_config["args"] = [
-                            "-m", "agent.mcp.server",
-                            "--source-type", "postgres",
-                            "--postgres-dsn", self.connection_string,
-                            "--agent-name", tool_name
-                        ]
-                    
-                    if tool["env"]:
-                        server_config["env"] = tool["env"]
             else:
-                # Resolve "python" keyword for MCP servers
-                command = tool["command"]
-                if command == "python":
-                    command = sys.executable
-                
                 server_config = {
-                    "transport": tool["transport"],
-                    "command": command
+                    "transport": transport,
+                    "command": _resolve_cmd(tool["command"])
                 }
-                if tool["args"]:
-                    server_config["args"] = tool["args"]
-                if tool["env"]:
-                    server_config["env"] = tool["env"]
+                if args:
+                    server_config["args"] = args
+            
+            if env:
+                server_config["env"] = env
             
             servers[tool_name] = server_config
         
@@ -400,40 +513,3 @@ class PostgresSource:
                 "servers": servers
             }
         ]
-    
-    def _get_agent_instance_endpoint(self, agent_name: str) -> Optional[str]:
-        """Get endpoint URL for a running agent instance.
-        
-        Queries agent_instances table to find the most recent healthy instance
-        based on heartbeat freshness (within last 20 minutes).
-        
-        Args:
-            agent_name: Name of the agent to find
-            
-        Returns:
-            Endpoint URL if healthy instance found, None otherwise
-        """
-        try:
-            conn = self._connect()
-            cur = conn.cursor()
-            
-            cur.execute("""
-                SELECT ai.endpoint_url
-                FROM agent_instances ai
-                JOIN agents a ON ai.agent_id = a.id
-                WHERE a.name = %s
-                  AND ai.last_heartbeat > NOW() - INTERVAL '20 minutes'
-                ORDER BY ai.last_heartbeat DESC
-                LIMIT 1
-            """, (agent_name,))
-            
-            result = cur.fetchone()
-            if result:
-                return result['endpoint_url']
-            return None
-        except Exception as e:
-            import sys
-            print(f"Warning: Failed to query agent instance for {agent_name}: {e}", file=sys.stderr)
-            return None
-    
-
@@ -3,7 +3,8 @@
 Defines the interactive Agent and the AgentFactory responsible
 for assembling it from configuration and infrastructure.
 """
-from typing import AsyncGenerator
+import io
+from typing import AsyncGenerator, Iterable
 
 from langchain.agents import create_agent
 
@@ -13,30 +14,18 @@ from agent.infrastructure.middleware.resolver import MiddlewareResolver
 from agent.infrastructure.tools.resolver import ToolResolver
 from agent.infrastructure.checkpointer.resolver import CheckpointerResolver
 
+_SUMMARY_PREFIX = "SummarizationMiddleware"
 
-def _register_providers() -> None:
-	"""Register all infrastructure providers with their resolvers.
-	
-	These imports trigger decorator-based registration. They are not
-	directly referenced but are required for the resolvers to function.
-	"""
-	# LLM providers
-	import agent.infrastructure.llm.providers.openai  # noqa: F401
-	
-	# Middleware providers
-	import agent.infrastructure.middleware.providers.summarization  # noqa: F401
-	
-	# Tool providers
-	import agent.infrastructure.tools.providers.mcp  # noqa: F401
-	
-	# Checkpointer providers
-	import agent.infrastructure.checkpointer.providers.memory  # noqa: F401
-	import agent.infrastructure.checkpointer.providers.sqlite  # noqa: F401
-	import agent.infrastructure.checkpointer.providers.postgres  # noqa: F401
 
-
-# Bootstrap: Register all providers at module import time
-_register_providers()
+def _text_parts(content) -> Iterable[str]:
+	"""Extract text items from structured (list) message content."""
+	if isinstance(content, list):
+		return (
+			item.get("text", "")
+			for item in content
+			if isinstance(item, dict) and item.get("type") == "text"
+		)
+	return ()
 
 
 class Agent:
@@ -59,10 +48,10 @@ class Agent:
 		Returns:
 			Complete agent response as a string
 		"""
-		response_parts = []
+		buf = io.StringIO()
 		async for token in self.stream(query, thread_id):
-			response_parts.append(token)
-		return "".join(response_parts)
+			buf.write(token)
+		return buf.getvalue()
 
 	async def stream(self, query: str, thread_id: str) -> AsyncGenerator[str, None]:
 		"""Stream agent response tokens.
@@ -79,30 +68,15 @@ class Agent:
 			config={"configurable": {"thread_id": thread_id}},
 			stream_mode="messages",
 		):
-			if self._is_not_summary_chunk(metadata):
-				# Handle both string content and structured content (e.g., tool responses)
-				content = token.content
-				if isinstance(content, list):
-					# Structured content from tool responses - extract text
-					for item in content:
-						if isinstance(item, dict) and item.get("type") == "text":
-							yield item.get("text", "")
-				elif isinstance(content, str):
-					yield content
-
-	def _is_not_summary_chunk(self, metadata: dict) -> bool:
-		"""Check if a chunk is not from summarization middleware.
-		
-		Args:
-			metadata: Chunk metadata
-			
-		Returns:
-			True if chunk should be included in output
-		"""
-		is_summary_chunk = metadata.get("langgraph_node", "").startswith(
-			"SummarizationMiddleware"
-		)
-		return not is_summary_chunk
+			if metadata.get("langgraph_node", "").startswith(_SUMMARY_PREFIX):
+				continue
+			content = token.content
+			if isinstance(content, str):
+				yield content
+			else:
+				# Structured content (e.g., tool responses)
+				for text in _text_parts(content):
+					yield text
 
 
 class AgentFactory:
@@ -111,10 +85,13 @@ class AgentFactory:
 	@staticmethod
 	async def create(config: AgentConfig) -> Agent:
 		"""Create and initialize an Agent instance from configuration."""
-		tools = await ToolResolver.resolve_all(config.tool_configs)
+		# These resolvers are cheap and CPU-bound, and they may lazily import
+		# providers into the shared registries, so they stay on the loop
+		# thread; the checkpointer is also used from this thread later.
 		llm = LLMResolver.resolve(config.model_name, config.temperature)
 		middleware = MiddlewareResolver.resolve_all(config.middleware_configs)
 		checkpointer = CheckpointerResolver.resolve(config.checkpointer_config)
+		tools = await ToolResolver.resolve_all(config.tool_configs)
 
 		graph = create_agent(
 			model=llm,
@@ -1,21 +1,28 @@
 """Postgres checkpointer provider."""
-from typing import Any, Dict
-
-try:
-    from langgraph.checkpoint.postgres import PostgresSaver
-except ImportError:  # pragma: no cover - optional dependency
-    PostgresSaver = None  # type: ignore
+import functools
+from typing import Any, Dict, Optional
 
 from ..resolver import CheckpointerResolver
 
 
+@functools.lru_cache(maxsize=1)
+def _saver_cls() -> Optional[type]:
+    """Import PostgresSaver on first use; None if the optional dependency is missing."""
+    try:
+        from langgraph.checkpoint.postgres import PostgresSaver
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return PostgresSaver
+
+
 @CheckpointerResolver.register("postgres")
 def _build_postgres_saver(config: Dict[str, Any]) -> Any:
     """Build a PostgresSaver checkpointer instance."""
-    if PostgresSaver is None:
+    saver_cls = _saver_cls()
+    if saver_cls is None:
         raise ImportError("PostgresSaver is not available. Install langgraph with postgres extras.")
 
     connection_string = config.get("connection_string")
     if not connection_string:
         raise ValueError("Postgres checkpointer requires 'connection_string'")
-    return PostgresSaver(connection_string=connection_string)
+    return saver_cls(connection_string=connection_string)
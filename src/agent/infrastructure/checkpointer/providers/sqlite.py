@@ -1,21 +1,28 @@
 """SQLite checkpointer provider."""
-from typing import Any, Dict
-
-try:
-    from langgraph.checkpoint.sqlite import SqliteSaver
-except ImportError:  # pragma: no cover - optional dependency
-    SqliteSaver = None  # type: ignore
+import functools
+from typing import Any, Dict, Optional
 
 from ..resolver import CheckpointerResolver
 
 
+@functools.lru_cache(maxsize=1)
+def _saver_cls() -> Optional[type]:
+    """Import SqliteSaver on first use; None if the optional dependency is missing."""
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return SqliteSaver
+
+
 @CheckpointerResolver.register("sqlite")
 def _build_sqlite_saver(config: Dict[str, Any]) -> Any:
     """Build a SqliteSaver checkpointer instance."""
-    if SqliteSaver is None:
+    saver_cls = _saver_cls()
+    if saver_cls is None:
         raise ImportError("SqliteSaver is not available. Install langgraph with sqlite extras.")
 
     path = config.get("path")
     if not path:
         raise ValueError("Sqlite checkpointer requires 'path' to be set")
-    return SqliteSaver(path)
+    return saver_cls(path)
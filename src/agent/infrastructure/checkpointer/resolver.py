@@ -1,9 +1,17 @@
 """Checkpointer resolver infrastructure for building agent checkpointers."""
 from typing import Any, Callable, Dict, Optional
 
+from ..registry import load_builder
 from .specs import CheckpointerSpec
 
 
+# Built-in providers, imported on first use (see load_builder)
+_PROVIDER_MODULES: Dict[str, str] = {
+    "memory": "agent.infrastructure.checkpointer.providers.memory",
+    "sqlite": "agent.infrastructure.checkpointer.providers.sqlite",
+    "postgres": "agent.infrastructure.checkpointer.providers.postgres",
+}
+
 Builder = Callable[[Dict[str, Any]], Any]
 
 
@@ -22,6 +30,11 @@ class CheckpointerResolver:
 
         return decorator
 
+    @classmethod
+    def _load_builder(cls, checkpointer_type: str) -> Builder:
+        """Import the built-in provider for a type and return its builder."""
+        return load_builder(cls._REGISTRY, _PROVIDER_MODULES, "checkpointer", checkpointer_type)
+
     @classmethod
     def resolve(cls, config: Optional[CheckpointerSpec]) -> Any:
         """Resolve a checkpointer instance from configuration."""
@@ -30,8 +43,5 @@ class CheckpointerResolver:
 
         checkpointer_type = config.get("type", "memory")
 
-        if checkpointer_type not in cls._REGISTRY:
-            raise ValueError(f"Unknown checkpointer type: {checkpointer_type}")
-
-        builder = cls._REGISTRY[checkpointer_type]
+        builder = cls._REGISTRY.get(checkpointer_type) or cls._load_builder(checkpointer_type)
         return builder(config)
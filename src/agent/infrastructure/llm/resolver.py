@@ -1,9 +1,15 @@
 """LLM resolver infrastructure for building language models."""
 from typing import Any, Callable, Dict
 
+from ..registry import load_builder
 from .specs import LLMSpec
 
 
+# Built-in providers, imported on first use (see load_builder)
+_PROVIDER_MODULES: Dict[str, str] = {
+    "openai": "agent.infrastructure.llm.providers.openai",
+}
+
 Builder = Callable[[Dict[str, Any]], Any]
 
 
@@ -22,6 +28,11 @@ class LLMResolver:
 
         return decorator
 
+    @classmethod
+    def _load_builder(cls, llm_type: str) -> Builder:
+        """Import the built-in provider for a type and return its builder."""
+        return load_builder(cls._REGISTRY, _PROVIDER_MODULES, "LLM", llm_type)
+
     @classmethod
     def resolve(cls, model_name: str, temperature: float) -> Any:
         """Resolve an LLM instance from configuration.
@@ -37,16 +48,12 @@ class LLMResolver:
             This method uses a simplified API for backward compatibility.
             The type is automatically determined from available providers.
         """
+        llm_type = "openai"  # Default to OpenAI for now
         config = {
-            "type": "openai",  # Default to OpenAI for now
+            "type": llm_type,
             "model_name": model_name,
             "temperature": temperature
         }
         
-        llm_type = config.get("type", "openai")
-        
-        if llm_type not in cls._REGISTRY:
-            raise ValueError(f"Unknown LLM type: {llm_type}")
-        
-        builder = cls._REGISTRY[llm_type]
+        builder = cls._REGISTRY.get(llm_type) or cls._load_builder(llm_type)
         return builder(config)
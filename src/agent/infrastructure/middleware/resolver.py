@@ -1,9 +1,15 @@
 """Middleware resolver infrastructure for building agent middleware."""
 from typing import Any, Callable, Dict, List, Optional
 
+from ..registry import load_builder
 from .specs import MiddlewareSpec
 
 
+# Built-in providers, imported on first use (see load_builder)
+_PROVIDER_MODULES: Dict[str, str] = {
+    "summarization": "agent.infrastructure.middleware.providers.summarization",
+}
+
 Builder = Callable[[Dict[str, Any]], Any]
 
 
@@ -22,6 +28,11 @@ class MiddlewareResolver:
 
         return decorator
 
+    @classmethod
+    def _load_builder(cls, middleware_type: str) -> Builder:
+        """Import the built-in provider for a type and return its builder."""
+        return load_builder(cls._REGISTRY, _PROVIDER_MODULES, "middleware", middleware_type)
+
     @classmethod
     def resolve(cls, config: Dict[str, Any]) -> Optional[Any]:
         """Resolve a single middleware instance from configuration.
@@ -43,10 +54,7 @@ class MiddlewareResolver:
 
         middleware_type = config.get("type")
 
-        if middleware_type not in cls._REGISTRY:
-            raise ValueError(f"Unknown middleware type: {middleware_type}")
-
-        builder = cls._REGISTRY[middleware_type]
+        builder = cls._REGISTRY.get(middleware_type) or cls._load_builder(middleware_type)
         return builder(config)
 
     @classmethod
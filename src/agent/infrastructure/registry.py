@@ -0,0 +1,30 @@
+"""Shared lookup for the resolver registries."""
+import importlib
+from typing import Callable, Dict
+
+
+def load_builder(
+    registry: Dict[str, Callable], provider_modules: Dict[str, str], kind: str, type_name: str
+) -> Callable:
+    """Return the builder registered for a type, importing its built-in provider first.
+
+    Built-in providers register themselves with their resolver when their
+    module is imported, so they are imported here on first use; their
+    dependencies are only loaded when a config actually needs them.
+
+    Args:
+        registry: The resolver's type -> builder registry
+        provider_modules: Built-in type -> provider module path map
+        kind: Resolver kind used in the error message (e.g. "tool")
+        type_name: The configured type to look up
+
+    Raises:
+        ValueError: If no builder is registered for the type
+    """
+    module = provider_modules.get(type_name)
+    if module is not None:
+        importlib.import_module(module)
+    try:
+        return registry[type_name]
+    except KeyError:
+        raise ValueError(f"Unknown {kind} type: {type_name}") from None
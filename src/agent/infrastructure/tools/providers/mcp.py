@@ -1,11 +1,54 @@
 """MCP tool builder for agent tools."""
-from typing import Any, Dict, List
+import asyncio
+import itertools
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
 from ..resolver import ToolResolver
 
 
+# Tools already fetched in this process, keyed by each server's canonical
+# config and stored with an expiry time. Adapter tools open their own
+# session per call, so they can be reused by later agent builds; a server
+# whose tool list changes is picked up again once its entry expires.
+_TOOL_CACHE: Dict[str, Tuple[float, List[Any]]] = {}
+_CACHE_TTL = float(os.getenv("MCP_TOOLS_TTL", "60"))
+
+
+def clear_mcp_cache() -> None:
+    """Forget cached MCP tools, so the next build lists them again."""
+    _TOOL_CACHE.clear()
+
+
+def _cache_key(name: str, connection: Dict[str, Any]) -> Optional[str]:
+    try:
+        return json.dumps([name, connection], sort_keys=True)
+    except (TypeError, ValueError):
+        # Connections holding live objects (auth handlers etc.) are not cached
+        return None
+
+
+async def _get_server_tools(name: str, connection: Dict[str, Any]) -> List[Any]:
+    key = _cache_key(name, connection)
+    cached = _TOOL_CACHE.get(key) if key is not None else None
+    if cached is not None and time.monotonic() < cached[0]:
+        return list(cached[1])
+
+    client = MultiServerMCPClient({name: connection})
+    tools = await client.get_tools()
+    if key is not None:
+        now = time.monotonic()
+        # Drop expired entries so configs that are no longer used do not pile up
+        for stale in [k for k, (expires, _) in _TOOL_CACHE.items() if expires <= now]:
+            del _TOOL_CACHE[stale]
+        _TOOL_CACHE[key] = (now + _CACHE_TTL, tools)
+    return list(tools)
+
+
 @ToolResolver.register("mcp")
 async def _build_mcp_tools(config: Dict[str, Any]) -> List[Any]:
     """Build LangGraph tools from MCP servers."""
@@ -13,6 +56,9 @@ async def _build_mcp_tools(config: Dict[str, Any]) -> List[Any]:
     if not servers:
         return []
 
-    client = MultiServerMCPClient(servers)
-    tools = await client.get_tools()
-    return tools
+    # One client per server so every list_tools round trip overlaps, even
+    # on adapter versions whose get_tools() walks servers one at a time.
+    results = await asyncio.gather(
+        *(_get_server_tools(name, conn) for name, conn in servers.items())
+    )
+    return list(itertools.chain.from_iterable(results))
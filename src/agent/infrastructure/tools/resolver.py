@@ -1,9 +1,17 @@
 """Tool resolver infrastructure for building agent tools."""
+import asyncio
+import itertools
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from ..registry import load_builder
 from .specs import ToolSpec
 
 
+# Built-in providers, imported on first use (see load_builder)
+_PROVIDER_MODULES: Dict[str, str] = {
+    "mcp": "agent.infrastructure.tools.providers.mcp",
+}
+
 Builder = Callable[[Dict[str, Any]], Awaitable[List[Any]]]
 
 
@@ -22,24 +30,30 @@ class ToolResolver:
 
         return decorator
 
+    @classmethod
+    def _load_builder(cls, tool_type: str) -> Builder:
+        """Import the built-in provider for a type and return its builder."""
+        return load_builder(cls._REGISTRY, _PROVIDER_MODULES, "tool", tool_type)
+
     @classmethod
     async def resolve_all(cls, configs: Optional[List[ToolSpec]]) -> List[Any]:
         """Resolve all tool instances from configuration list."""
         if not configs:
             return []
 
-        tools: List[Any] = []
+        # Look up every builder before starting any, so an unknown type
+        # fails before network I/O begins.
+        registry = cls._REGISTRY
+        pending = []
         for config in configs:
             if not config.get("enabled", True):
                 continue
 
             tool_type = config.get("type")
-            if tool_type not in cls._REGISTRY:
-                raise ValueError(f"Unknown tool type: {tool_type}")
-
-            builder = cls._REGISTRY[tool_type]
-            built_tools = await builder(config)
-            if built_tools:
-                tools.extend(built_tools)
+            builder = registry.get(tool_type) or cls._load_builder(tool_type)
+            pending.append((builder, config))
 
-        return tools
+        # Builders typically do network round trips (MCP handshakes), so
+        # run them concurrently; results keep config order.
+        results = await asyncio.gather(*(builder(config) for builder, config in pending))
+        return list(itertools.chain.from_iterable(filter(None, results)))
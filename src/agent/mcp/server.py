@@ -14,14 +14,17 @@ IMPLEMENTED:
 
 - Self-registration on startup:
   - Agents register themselves in agent_instances when they start
+  - Registration runs on the heartbeat thread so server bind is not delayed
   - Endpoint URL constructed from env vars: AGENT_HOSTNAME, MCP_INTERNAL_PORT
   - Uses single atomic CTE query to lookup agent_id/version_id and insert
 
 - Heartbeat mechanism:
   - Background thread sends periodic UPDATE to last_heartbeat
+  - One persistent connection with a prepared UPDATE, reconnecting on failure
   - Defaults to 900 seconds (15 min), configurable via HEARTBEAT_INTERVAL_SECONDS
   - First heartbeat runs immediately on startup
   - No status transitions - just heartbeat timestamp updates
+  - On shutdown the heartbeat thread is woken and sets stopped_at
 
 - Agent-to-agent HTTP communication:
   - Agents can use other agents as tools via MCP protocol
@@ -39,26 +42,36 @@ DESIGN DECISIONS:
 NEXT STEPS (if resuming):
 - Test supervisor-agent calling demo-agent via HTTP in production
 - Consider adding metrics/observability for agent communication
-- May need to handle stopped_at timestamp on graceful shutdown
 - Consider cleanup job for stale instances (heartbeat > X hours old)
 ============================================================================
 """
 import argparse
 import asyncio
+import functools
 import os
+import random
+import sys
 import threading
+from typing import Optional
 from uuid import UUID
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
+try:
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+except ImportError:  # pragma: no cover - only needed for the postgres source
+    psycopg2 = None
+
 from agent.bootstrap import create_agent_from_args
 
 _agent = None
-_agent_lock = asyncio.Lock()
+_agent_lock = None
 _args = None
 _mcp = None
 _instance_id = None
+_stop_heartbeat = threading.Event()
 
 
 async def get_agent():
@@ -67,8 +80,12 @@ async def get_agent():
     Returns:
         Initialized Agent instance
     """
-    global _agent
+    global _agent, _agent_lock
     if _agent is None:
+        # Created on first use so the lock belongs to the serving loop,
+        # not whichever loop (if any) existed at import time
+        if _agent_lock is None:
+            _agent_lock = asyncio.Lock()
         async with _agent_lock:
             if _agent is None:
                 _agent = await create_agent_from_args(_args)
@@ -94,27 +111,36 @@ async def chat(message: str, thread_id: str = "default") -> str:
     return reply
 
 
-async def register_agent_instance(args: argparse.Namespace) -> UUID:
+async def register_agent_instance(
+    args: argparse.Namespace, endpoint_url: Optional[str] = None
+) -> Optional[UUID]:
     """Register this agent instance in the database.
     
     Args:
         args: Parsed command-line arguments containing postgres connection info
+        endpoint_url: URL other agents use to reach this instance; built
+            from AGENT_HOSTNAME and MCP_INTERNAL_PORT when omitted
         
     Returns:
-        UUID of the created instance record
+        UUID of the created instance record, or None if registration
+        failed or psycopg2 is not installed
     """
+    if psycopg2 is None:
+        print("Warning: psycopg2 is not installed; skipping agent instance registration", file=sys.stderr)
+        return None
+    
     try:
-        import psycopg2
-        from psycopg2.extras import RealDictCursor
-        
         conn = psycopg2.connect(args.postgres_dsn, cursor_factory=RealDictCursor)
         cur = conn.cursor()
         
-        hostname = os.getenv('AGENT_HOSTNAME', args.agent_name)
-        internal_port = int(os.getenv('MCP_INTERNAL_PORT', '8000'))
-        endpoint_url = f"http://{hostname}:{internal_port}"
+        if endpoint_url is None:
+            hostname = os.getenv('AGENT_HOSTNAME', args.agent_name)
+            internal_port = int(os.getenv('MCP_INTERNAL_PORT', '8000'))
+            endpoint_url = f"http://{hostname}:{internal_port}"
         
         # Insert instance record with initial heartbeat
+        # Runs once per process, so it is not prepared; the lookup is served
+        # by the agents.name unique index and agent_one_active_version
         cur.execute("""
             WITH agent_data AS (
                 SELECT a.id as agent_id, av.id as agent_version_id
@@ -141,61 +167,152 @@ async def register_agent_instance(args: argparse.Namespace) -> UUID:
         
         return instance_id
         
-    except Exception as e:
-        import sys
+    except (psycopg2.Error, ValueError) as e:
         print(f"Warning: Failed to register agent instance: {e}", file=sys.stderr)
         # Don't fail agent startup if registration fails
         return None
 
 
-def send_heartbeat(instance_id: UUID, postgres_dsn: str) -> None:
+_HEARTBEAT_PREPARE = """
+    PREPARE heartbeat AS
+    UPDATE agent_instances
+    SET last_heartbeat = NOW()
+    WHERE id = $1
+"""
+
+
+def send_heartbeat(instance_id: UUID, postgres_dsn: str, conn=None):
     """Send heartbeat update for this agent instance.
     
+    Reuses ``conn`` when given so each beat is a single prepared EXECUTE
+    rather than a fresh connect. Any failure drops the connection; the
+    next beat reconnects. Only database errors are caught.
+    
     Args:
         instance_id: UUID of the instance record
         postgres_dsn: PostgreSQL connection string
+        conn: Connection returned by the previous call, if any
+        
+    Returns:
+        Connection to pass to the next call, or None after a failure
     """
     if instance_id is None:
-        return
+        return conn
     
     try:
-        import psycopg2
-        conn = psycopg2.connect(postgres_dsn)
-        cur = conn.cursor()
-        
-        cur.execute("""
-            UPDATE agent_instances 
-            SET last_heartbeat = NOW()
-            WHERE id = %s
-        """, (instance_id,))
-        conn.commit()
+        if conn is None:
+            conn = psycopg2.connect(postgres_dsn)
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(_HEARTBEAT_PREPARE)
         
-        cur.close()
-        conn.close()
-    except Exception as e:
-        import sys
+        with conn.cursor() as cur:
+            cur.execute("EXECUTE heartbeat(%s)", (instance_id,))
+        return conn
+    except psycopg2.Error as e:
         print(f"Warning: Failed to send heartbeat: {e}", file=sys.stderr)
+        if conn is not None:
+            try:
+                conn.close()
+            except psycopg2.Error:
+                pass
+        return None
+
+
+def mark_instance_stopped(instance_id: UUID, postgres_dsn: str, conn=None) -> None:
+    """Record shutdown for this agent instance and close the connection.
+    
+    Args:
+        instance_id: UUID of the instance record
+        postgres_dsn: PostgreSQL connection string
+        conn: Open heartbeat connection to reuse, if any
+    """
+    if instance_id is None:
+        return
+    
+    try:
+        if conn is None:
+            conn = psycopg2.connect(postgres_dsn)
+            conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE agent_instances
+                SET stopped_at = NOW()
+                WHERE id = %s
+            """, (instance_id,))
+    except psycopg2.Error as e:
+        print(f"Warning: Failed to record instance shutdown: {e}", file=sys.stderr)
+    finally:
+        if conn is not None:
+            try:
+                conn.close()
+            except psycopg2.Error:
+                pass
+
+
+# First retry delay after a failed heartbeat; doubles up to the interval
+_HEARTBEAT_RETRY_BASE = 30
+
+
+def _heartbeat_delay(interval_seconds: int, failures: int) -> float:
+    """Seconds until the next heartbeat after ``failures`` consecutive errors.
+    
+    Retries start after _HEARTBEAT_RETRY_BASE seconds and double per
+    failure, never exceeding the configured interval, so the instance is
+    marked alive again soon after the database recovers. Jitter only
+    shortens the delay and keeps a fleet of agents from retrying in lockstep.
+    """
+    if not failures:
+        return interval_seconds
+    delay = min(_HEARTBEAT_RETRY_BASE * 2 ** (failures - 1), interval_seconds)
+    return delay - random.uniform(0, delay * 0.1)
 
 
 def heartbeat_worker(instance_id: UUID, postgres_dsn: str, interval_seconds: int) -> None:
     """Background thread that sends periodic heartbeats.
     
-    Runs first heartbeat immediately, then repeats at interval.
+    Runs first heartbeat immediately, then repeats at interval over one
+    long-lived connection until _stop_heartbeat is set, at which point
+    it records stopped_at and returns. Consecutive failures back off
+    (see _heartbeat_delay).
     
     Args:
         instance_id: UUID of the instance record
         postgres_dsn: PostgreSQL connection string
         interval_seconds: Seconds between heartbeats
     """
-    import time
+    if instance_id is None:
+        return
     
     # Send first heartbeat immediately
-    send_heartbeat(instance_id, postgres_dsn)
+    conn = send_heartbeat(instance_id, postgres_dsn)
+    failures = 0 if conn is not None else 1
+    
+    # Then send periodic heartbeats; wait() returns early on shutdown
+    while not _stop_heartbeat.wait(_heartbeat_delay(interval_seconds, failures)):
+        conn = send_heartbeat(instance_id, postgres_dsn, conn)
+        failures = 0 if conn is not None else failures + 1
     
-    # Then send periodic heartbeats
-    while True:
-        time.sleep(interval_seconds)
-        send_heartbeat(instance_id, postgres_dsn)
+    mark_instance_stopped(instance_id, postgres_dsn, conn)
+
+
+def registration_worker(
+    args: argparse.Namespace, interval_seconds: int, endpoint_url: Optional[str] = None
+) -> None:
+    """Background thread that registers this instance, then heartbeats.
+    
+    Runs off the main thread so the HTTP listener binds without waiting
+    on the Postgres round trip.
+    
+    Args:
+        args: Parsed command-line arguments containing postgres connection info
+        interval_seconds: Seconds between heartbeats
+        endpoint_url: URL to register for this instance
+    """
+    global _instance_id
+    
+    _instance_id = asyncio.run(register_agent_instance(args, endpoint_url))
+    heartbeat_worker(_instance_id, args.postgres_dsn, interval_seconds)
 
 
 def run_mcp_server() -> None:
@@ -205,26 +322,30 @@ def run_mcp_server() -> None:
     load_dotenv()
     
     # TODO: Need to figure out how to make langchain tracing work
-    import os
     os.environ["LANGCHAIN_TRACING_V2"] = "false"
     
     _args = parse_args()
     
+    # Read deployment settings once; they are shared by bind and registration
+    internal_port = int(os.getenv("MCP_INTERNAL_PORT", "8000"))
+    hostname = os.getenv("AGENT_HOSTNAME", _args.agent_name)
+    
     _mcp = FastMCP(name=_args.agent_name)
     
     # Register the chat tool using add_tool with the mcp instance decorator
     _mcp.add_tool(_mcp.tool()(chat))
     
     # Register agent instance on startup if using postgres
+    heartbeat_thread = None
     if _args.source_type == "postgres":
-        _instance_id = asyncio.run(register_agent_instance(_args))
-        # Start heartbeat thread in background
+        # Registration and heartbeats share one background thread so the
+        # server binds without waiting on the database
         # HEARTBEAT_INTERVAL_SECONDS: defaults to 900 (15 minutes)
-        # First heartbeat runs immediately, then repeats at interval
+        # First heartbeat runs right after registration, then repeats at interval
         heartbeat_interval = int(os.getenv("HEARTBEAT_INTERVAL_SECONDS", "900"))
         heartbeat_thread = threading.Thread(
-            target=heartbeat_worker,
-            args=(_instance_id, _args.postgres_dsn, heartbeat_interval),
+            target=registration_worker,
+            args=(_args, heartbeat_interval, f"http://{hostname}:{internal_port}"),
             daemon=True
         )
         heartbeat_thread.start()
@@ -232,20 +353,28 @@ def run_mcp_server() -> None:
     try:
         # Run the FastMCP server with HTTP transport
         # Bind to 0.0.0.0 to accept connections from outside the container
-        internal_port = int(os.getenv("MCP_INTERNAL_PORT", "8000"))
         _mcp.run(transport="http", host="0.0.0.0", port=internal_port, show_banner=False)
     except KeyboardInterrupt:
         # Write to stderr, not stdout
-        import sys
         print("\nShutting down MCP server...", file=sys.stderr)
     except Exception as e:
-        import sys
         print(f"Error: {e}", file=sys.stderr)
         exit(1)
+    finally:
+        # The server handles SIGTERM itself and returns here; wake the
+        # heartbeat thread so it can record stopped_at before we exit
+        if heartbeat_thread is not None:
+            _stop_heartbeat.set()
+            heartbeat_thread.join(timeout=5)
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments for MCP server."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the MCP server argument parser once.
+    
+    Env-var backed options default to None here and are filled in by
+    parse_args, so the cached parser still sees the current environment.
+    """
     parser = argparse.ArgumentParser(
         description="Run agent as MCP server",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -262,7 +391,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--source-type",
         type=str,
-        default=os.getenv("SOURCE_TYPE", "postgres"),
+        default=None,
         choices=["filesystem", "postgres"],
         help="Configuration source type (default: postgres, or SOURCE_TYPE env var)",
     )
@@ -270,14 +399,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--postgres-dsn",
         type=str,
-        default=os.getenv("POSTGRES_DSN"),
+        default=None,
         help="PostgreSQL connection string (required for postgres source, defaults to POSTGRES_DSN env var)",
     )
     
     parser.add_argument(
         "--agent-name",
         type=str,
-        default=os.getenv("AGENT_NAME"),
+        default=None,
         help="Agent name to load from database (required for postgres source, defaults to AGENT_NAME env var)",
     )
     
@@ -287,8 +416,22 @@ def parse_args() -> argparse.Namespace:
         help="Run without loading MCP tools",
     )
     
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments for MCP server."""
+    parser = _build_parser()
     args = parser.parse_args()
     
+    # Env-var defaults are read at parse time, not when the parser was built
+    if args.source_type is None:
+        args.source_type = os.getenv("SOURCE_TYPE", "postgres")
+    if args.postgres_dsn is None:
+        args.postgres_dsn = os.getenv("POSTGRES_DSN")
+    if args.agent_name is None:
+        args.agent_name = os.getenv("AGENT_NAME")
+    
     # Validate postgres source requirements
     if args.source_type == "postgres":
         if not args.postgres_dsn:
@@ -15,11 +15,14 @@ def configure_langsmith(agent_name: str) -> None:
     Args:
         agent_name: Name of the agent for project naming
     """
-    if os.getenv("LANGCHAIN_API_KEY"):
-        if not os.getenv("LANGCHAIN_TRACING_V2"):
-            os.environ["LANGCHAIN_TRACING_V2"] = "true"
-        if not os.getenv("LANGCHAIN_PROJECT"):
-            os.environ["LANGCHAIN_PROJECT"] = f"{agent_name}-project"
-        print(f"LangSmith tracing enabled for project: {os.getenv('LANGCHAIN_PROJECT')}", file=sys.stderr)
-    else:
+    env = os.environ
+    if not env.get("LANGCHAIN_API_KEY"):
         print("LangSmith tracing disabled. Set LANGCHAIN_API_KEY in .env to enable.", file=sys.stderr)
+        return
+    
+    if not env.get("LANGCHAIN_TRACING_V2"):
+        env["LANGCHAIN_TRACING_V2"] = "true"
+    project = env.get("LANGCHAIN_PROJECT")
+    if not project:
+        project = env["LANGCHAIN_PROJECT"] = f"{agent_name}-project"
+    print(f"LangSmith tracing enabled for project: {project}", file=sys.stderr)
@@ -1,7 +1,29 @@
 """Tests for CLI chat handler."""
 import pytest
+from contextlib import ExitStack, contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
+_UI_FUNCS = (
+    "get_input",
+    "print_assistant_prefix",
+    "print_error",
+    "print_separator",
+    "print_system",
+    "print_user_prompt",
+)
+
+
+@contextmanager
+def patch_ui(**overrides):
+    """Patch the UI functions imported by the chat handler with one mock namespace."""
+    ui = MagicMock()
+    for name, value in overrides.items():
+        setattr(ui, name, value)
+    with ExitStack() as stack:
+        for name in _UI_FUNCS:
+            stack.enter_context(patch(f"agent.cli.chat_handler.{name}", getattr(ui, name)))
+        yield ui
+
 
 @pytest.mark.asyncio
 async def test_given_query_when_start_session_called_then_invokes_agent_and_exits():
@@ -20,14 +42,19 @@ async def test_given_query_when_start_session_called_then_invokes_agent_and_exit
     
     handler = CLIChatHandler(mock_agent)
     
-    with patch("agent.cli.chat_handler.CLIInterface") as MockCLI:
+    with patch_ui() as MockCLI, \
+         patch("agent.cli.chat_handler.FlushingTokenBuffer") as MockBuffer:
         await handler.start_session(query="test query", thread_id="test-thread")
         
         # Verify UI interactions
         MockCLI.print_separator.assert_called()
         MockCLI.print_system.assert_called()
         MockCLI.print_assistant_prefix.assert_called()
-        MockCLI.print_chunk.assert_called()
+        
+        # Tokens go through the buffer, which is flushed when the stream ends
+        buf = MockBuffer.return_value
+        assert [c.args[0] for c in buf.write.call_args_list] == ["Test", " response"]
+        buf.flush.assert_called()
 
 
 @pytest.mark.asyncio
@@ -45,10 +72,8 @@ async def test_given_no_query_when_start_session_called_then_enters_interactive_
     
     handler = CLIChatHandler(mock_agent)
     
-    with patch("agent.cli.chat_handler.CLIInterface") as MockCLI:
-        # Simulate user typing "hello" then "exit"
-        MockCLI.get_input.side_effect = ["hello", "exit"]
-        
+    # Simulate user typing "hello" then "exit"
+    with patch_ui(get_input=AsyncMock(side_effect=["hello", "exit"])) as MockCLI:
         await handler.start_session()
         
         # Should have called get_input twice
@@ -70,8 +95,7 @@ async def test_given_new_command_when_interactive_session_then_creates_new_threa
     
     handler = CLIChatHandler(mock_agent)
     
-    with patch("agent.cli.chat_handler.CLIInterface") as MockCLI:
-        MockCLI.get_input.side_effect = ["new", "quit"]
+    with patch_ui(get_input=AsyncMock(side_effect=["new", "quit"])) as MockCLI:
         
         await handler.start_session()
         
@@ -90,8 +114,7 @@ async def test_given_empty_input_when_interactive_session_then_continues():
     
     handler = CLIChatHandler(mock_agent)
     
-    with patch("agent.cli.chat_handler.CLIInterface") as MockCLI:
-        MockCLI.get_input.side_effect = ["", "  ", "quit"]
+    with patch_ui(get_input=AsyncMock(side_effect=["", "  ", "quit"])) as MockCLI:
         
         await handler.start_session()
         
@@ -109,11 +132,76 @@ async def test_given_keyboard_interrupt_when_session_active_then_exits_gracefull
     
     handler = CLIChatHandler(mock_agent)
     
-    with patch("agent.cli.chat_handler.CLIInterface") as MockCLI:
-        MockCLI.get_input.side_effect = KeyboardInterrupt()
+    with patch_ui(get_input=AsyncMock(side_effect=KeyboardInterrupt())) as MockCLI:
         
         await handler.start_session()
         
         # Should have printed goodbye message
         goodbye_calls = [call[0][0] for call in MockCLI.print_system.call_args_list]
         assert any("goodbye" in str(call).lower() for call in goodbye_calls)
+
+
+@pytest.mark.asyncio
+async def test_given_repeated_new_commands_when_interactive_session_then_thread_ids_are_unique():
+    """Test that 'new' never reuses a thread ID, even within the same second."""
+    from agent.cli.chat_handler import CLIChatHandler
+    
+    mock_agent = MagicMock()
+    mock_agent.config = MagicMock(name="test-agent")
+    
+    handler = CLIChatHandler(mock_agent)
+    
+    with patch_ui(get_input=AsyncMock(side_effect=["new", "new", "quit"])) as MockCLI:
+        
+        await handler.start_session()
+        
+        system_calls = [str(call[0][0]) for call in MockCLI.print_system.call_args_list]
+        thread_ids = [msg.rsplit(" ", 1)[-1] for msg in system_calls if "thread ID" in msg]
+        assert len(thread_ids) == 3
+        assert len(set(thread_ids)) == 3
+
+
+@pytest.mark.asyncio
+async def test_given_stalled_stream_when_streaming_response_then_flushes_partial_text():
+    """Test that buffered text is shown while the agent stream is waiting."""
+    import asyncio
+    import io
+    from agent.cli.chat_handler import CLIChatHandler
+    from agent.cli.ui import FlushingTokenBuffer
+    
+    stream = io.StringIO()
+    seen_while_stalled = []
+    
+    async def mock_stream(*args, **kwargs):
+        yield "partial"
+        # Let the consumer drain the queue before the stream stalls
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        seen_while_stalled.append(stream.getvalue())
+        yield " rest"
+    
+    mock_agent = MagicMock()
+    mock_agent.stream = mock_stream
+    buf = FlushingTokenBuffer(stream, max_bytes=64, flush_on="\n", max_delay=60)
+    
+    await CLIChatHandler(mock_agent)._stream_response("q", "t", buf)
+    
+    assert seen_while_stalled == ["partial"]
+    assert stream.getvalue() == "partial rest"
+
+
+@pytest.mark.asyncio
+async def test_given_empty_query_when_start_session_called_then_enters_interactive_mode():
+    """Test that an empty --query is not sent to the agent."""
+    from agent.cli.chat_handler import CLIChatHandler
+    
+    mock_agent = MagicMock()
+    mock_agent.config = MagicMock(name="test-agent")
+    
+    handler = CLIChatHandler(mock_agent)
+    
+    with patch_ui(get_input=AsyncMock(side_effect=["quit"])) as MockCLI:
+        await handler.start_session(query="", thread_id="test-thread")
+        
+        MockCLI.get_input.assert_awaited_once()
+        mock_agent.stream.assert_not_called()
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from pathlib import Path
 import argparse
-from agent.cli.cli import main, parse_args
+from agent.cli.cli import _build_parser, main, parse_args
 
 @pytest.mark.asyncio
 async def test_given_missing_config_file_when_load_configs_called_then_raises_error():
@@ -25,11 +25,11 @@ async def test_given_no_mcp_flag_when_main_called_then_skips_mcp_loading():
     
     # Mock deps
     with patch("agent.cli.cli.parse_args", return_value=mock_args), \
-         patch("agent.cli.cli.load_dotenv"), \
+         patch("dotenv.load_dotenv"), \
          patch("agent.bootstrap.AgentFactory") as MockAgentFactory, \
          patch("agent.bootstrap.FilesystemSource") as MockSource, \
          patch("agent.bootstrap.AgentConfig") as MockAgentConfig, \
-         patch("agent.bootstrap.configure_langsmith"), \
+         patch("agent.observability.configure_langsmith"), \
          patch("agent.cli.cli.CLIChatHandler") as MockChatHandler:
              
         # Setup mocks
@@ -75,11 +75,11 @@ async def test_given_query_arg_when_main_called_then_invokes_agent_chat_with_que
     
     # Mock deps
     with patch("agent.cli.cli.parse_args", return_value=mock_args), \
-         patch("agent.cli.cli.load_dotenv"), \
+         patch("dotenv.load_dotenv"), \
          patch("agent.bootstrap.AgentFactory") as MockAgentFactory, \
          patch("agent.bootstrap.FilesystemSource") as MockSource, \
          patch("agent.bootstrap.AgentConfig") as MockAgentConfig, \
-         patch("agent.bootstrap.configure_langsmith"), \
+         patch("agent.observability.configure_langsmith"), \
          patch("agent.cli.cli.CLIChatHandler") as MockChatHandler:
              
         # Setup mocks
@@ -137,3 +137,10 @@ def test_given_all_args_when_parse_args_called_then_parses_correctly():
         assert args.interactive is True
         assert args.trace is True
         assert args.thread_id == "123"
+
+@pytest.mark.parametrize("argv", [[], ["some query"]])
+def test_given_no_flags_when_parse_args_called_then_fast_path_matches_argparse(argv):
+    with patch("sys.argv", ["cli.py", *argv]):
+        args = parse_args()
+    
+    assert vars(args) == vars(_build_parser().parse_args(argv))
@@ -1,4 +1,8 @@
-from agent.cli.ui import CLIInterface, Colors
+import io
+
+import pytest
+
+from agent.cli.ui import CLIInterface, Colors, FlushingTokenBuffer
 
 def test_given_message_when_print_system_called_then_prints_formatted(capsys):
     message = "System message"
@@ -8,10 +12,63 @@ def test_given_message_when_print_system_called_then_prints_formatted(capsys):
     expected_output = f"{Colors.SYSTEM}{message}{Colors.RESET}\n"
     assert captured.out == expected_output
 
-def test_given_input_when_get_input_called_then_returns_string(monkeypatch):
+@pytest.mark.asyncio
+async def test_given_input_when_get_input_called_then_returns_string(monkeypatch):
     expected_input = "user input"
     monkeypatch.setattr('builtins.input', lambda: expected_input)
     
-    result = CLIInterface.get_input()
+    result = await CLIInterface.get_input()
     assert result == expected_input
 
+@pytest.mark.asyncio
+async def test_given_eof_when_get_input_called_then_raises_eof_error(monkeypatch):
+    def raise_eof():
+        raise EOFError
+    monkeypatch.setattr('builtins.input', raise_eof)
+    
+    with pytest.raises(EOFError):
+        await CLIInterface.get_input()
+
+
+def test_given_small_tokens_when_buffer_written_then_flushes_on_newline():
+    stream = io.StringIO()
+    buf = FlushingTokenBuffer(stream, max_bytes=64, flush_on="\n", max_delay=60)
+
+    buf.write("Hello")
+    buf.write(" world")
+    assert stream.getvalue() == ""
+
+    buf.write("!\n")
+    assert stream.getvalue() == "Hello world!\n"
+
+def test_given_pending_tokens_when_buffer_flushed_then_writes_remainder():
+    stream = io.StringIO()
+    buf = FlushingTokenBuffer(stream, max_bytes=8, flush_on="\n", max_delay=60)
+
+    buf.write("abcdefghij")
+    assert stream.getvalue() == "abcdefghij"
+
+    buf.write("xyz")
+    buf.flush()
+    assert stream.getvalue() == "abcdefghijxyz"
+
+def test_given_binary_backed_stream_when_buffer_flushed_then_preserves_output_order():
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    buf = FlushingTokenBuffer(stream, max_bytes=64, flush_on="\n", max_delay=60)
+
+    stream.write("Assistant: ")
+    buf.write("héllo")
+    buf.flush()
+
+    assert raw.getvalue() == "Assistant: héllo".encode("utf-8")
+
+def test_given_multibyte_tokens_when_buffer_written_then_limit_counts_encoded_bytes():
+    stream = io.StringIO()
+    buf = FlushingTokenBuffer(stream, max_bytes=4, flush_on="\n", max_delay=60)
+
+    buf.write("é")
+    assert stream.getvalue() == ""
+
+    buf.write("é")
+    assert stream.getvalue() == "éé"
@@ -5,6 +5,7 @@ from agent.config import (
 from unittest.mock import patch
 import pytest
 import json
+import os
 from pathlib import Path
 
 
@@ -187,3 +188,96 @@ def test_full_load_flow_with_explicit_tools(tmp_path):
     assert config.tool_configs[0]["type"] == "custom"
     assert config.tool_configs[0]["name"] == "my-tool"
 
+
+
+def test_filesystem_source_repeated_loads_each_report_missing_mcp_config(tmp_path, capsys):
+    """The missing-MCP notice should print on every load, not only on a cache miss."""
+    agent_file = tmp_path / "agent.json"
+    agent_file.write_text('{"name": "test"}')
+    
+    source = FilesystemSource(tmp_path)
+    source.load()
+    source.load()
+    source.load(no_mcp=True)
+    
+    out = capsys.readouterr().out
+    assert out.count("No MCP servers config file found") == 2
+    assert out.count("--no-mcp flag used") == 1
+
+
+def test_filesystem_source_cached_load_returns_independent_copies(tmp_path):
+    """Mutating a loaded config, nested lists included, must not leak into later loads."""
+    agent_file = tmp_path / "agent.json"
+    agent_file.write_text('{"name": "test", "tools": [{"type": "custom"}]}')
+    
+    source = FilesystemSource(tmp_path)
+    first = source.load()
+    first["name"] = "mutated"
+    first["tools"].append({"type": "extra"})
+    first["tools"][0]["type"] = "changed"
+    
+    second = source.load()
+    assert second is not first
+    assert second["name"] == "test"
+    assert second["tools"] == [{"type": "custom"}]
+
+
+def test_filesystem_source_reloads_when_file_modified(tmp_path):
+    """Changing agent.json should invalidate the cached config."""
+    agent_file = tmp_path / "agent.json"
+    agent_file.write_text('{"name": "before"}')
+    
+    source = FilesystemSource(tmp_path)
+    assert source.load()["name"] == "before"
+    
+    agent_file.write_text('{"name": "after"}')
+    stat = agent_file.stat()
+    os.utime(agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    
+    assert source.load()["name"] == "after"
+
+
+def test_filesystem_source_reloads_when_size_changes_with_same_mtime(tmp_path):
+    """A rewrite that keeps the mtime (coarse timestamps) is caught by size."""
+    agent_file = tmp_path / "agent.json"
+    agent_file.write_text('{"name": "before"}')
+    stat = agent_file.stat()
+    
+    source = FilesystemSource(tmp_path)
+    assert source.load()["name"] == "before"
+    
+    agent_file.write_text('{"name": "after, longer"}')
+    os.utime(agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    
+    assert source.load()["name"] == "after, longer"
+
+
+def test_filesystem_source_loads_large_mcp_servers_file(tmp_path):
+    """Files past the mmap threshold should parse the same as small ones."""
+    servers = {f"srv{i}": {"command": "run", "args": ["x" * 64]} for i in range(2000)}
+    (tmp_path / "agent.json").write_text('{"name": "test"}')
+    mcp_file = tmp_path / "mcp_servers.json"
+    mcp_file.write_text(json.dumps(servers))
+    assert mcp_file.stat().st_size > 64 * 1024
+    
+    result = FilesystemSource(tmp_path).load()
+    
+    assert result["tools"][0]["servers"] == servers
+
+
+@pytest.mark.asyncio
+async def test_filesystem_source_load_async_matches_load(tmp_path):
+    """The async loader should assemble the same config as load()."""
+    (tmp_path / "agent.json").write_text('{"name": "test"}')
+    (tmp_path / "mcp_servers.json").write_text('{"srv": {"command": "run"}}')
+    
+    source = FilesystemSource(tmp_path)
+    assert await source.load_async() == source.load()
+    assert "tools" not in await source.load_async(no_mcp=True)
+
+
+@pytest.mark.asyncio
+async def test_filesystem_source_load_async_missing_file(tmp_path):
+    source = FilesystemSource(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        await source.load_async()
@@ -1,9 +1,18 @@
 import pytest
 from typing import Dict, Any
+from pytest_asyncio import is_async_test
 from agent.config.agent_config import AgentConfig
 
-@pytest.fixture
+def pytest_collection_modifyitems(items):
+    # Run every async test on one session-wide event loop instead of a fresh loop each
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+@pytest.fixture(scope="session")
 def valid_agent_config_dict() -> Dict[str, Any]:
+    # Shared across the run; tests must not mutate it
     return {
         "name": "test-agent",
         "model": {
@@ -23,7 +32,8 @@ def valid_agent_config_dict() -> Dict[str, Any]:
         }
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_agent_config(valid_agent_config_dict) -> AgentConfig:
+    # Shared across the run; tests only read it
     return AgentConfig.from_dict(valid_agent_config_dict)
 
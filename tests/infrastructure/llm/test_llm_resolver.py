@@ -1,7 +1,6 @@
 import pytest
 from langchain_openai import ChatOpenAI
 from agent.infrastructure.llm.resolver import LLMResolver
-import agent.infrastructure.llm.providers.openai
 
 
 def test_given_openai_key_when_resolve_llm_called_then_returns_chat_openai(monkeypatch):
@@ -20,10 +19,3 @@ def test_given_no_api_key_when_resolve_llm_called_then_raises_value_error(monkey
 
     with pytest.raises(ValueError, match="Only OpenAI models are supported"):
         LLMResolver.resolve("gpt-4", 0.5)
-
-
-def test_given_builder_function_when_register_decorator_called_then_adds_to_registry():
-    from agent.infrastructure.llm.resolver import LLMResolver
-
-    assert "openai" in LLMResolver._REGISTRY
-    assert callable(LLMResolver._REGISTRY["openai"])
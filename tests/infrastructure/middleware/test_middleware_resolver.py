@@ -1,39 +1,46 @@
 import pytest
 from typing import Dict, Any
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from agent.infrastructure.middleware.resolver import MiddlewareResolver
+
+
+@pytest.fixture
+def summarization_config() -> Dict[str, Any]:
+    return {
+        "type": "summarization",
+        "enabled": True,
+        "model": "gpt-4o-mini",
+        "trigger": {
+            "type": "tokens",
+            "value": 200
+        },
+        "keep": {
+            "type": "messages",
+            "value": 1
+        }
+    }
+
+
+@pytest.fixture
+def mock_summarization():
+    """Patch SummarizationMiddleware so it returns an instance echoing its arguments."""
+    with patch('agent.infrastructure.middleware.providers.summarization.SummarizationMiddleware') as mock_cls:
+        mock_cls.return_value = SimpleNamespace(
+            model="gpt-4o-mini",
+            trigger=("tokens", 200),
+            keep=("messages", 1),
+        )
+        yield mock_cls
 
 
 class TestMiddlewareResolver:
     """Tests for the MiddlewareResolver registry pattern."""
 
-    @patch('agent.infrastructure.middleware.providers.summarization.SummarizationMiddleware')
-    def test_given_summarization_config_when_resolve_called_then_returns_summarization_middleware(self, mock_summarization):
+    def test_given_summarization_config_when_resolve_called_then_returns_summarization_middleware(self, mock_summarization, summarization_config):
         """Test creating SummarizationMiddleware from config dictionary."""
-        from agent.infrastructure.middleware.resolver import MiddlewareResolver
-        import agent.infrastructure.middleware.providers.summarization
-
-        # Setup mock
-        mock_instance = MagicMock()
-        mock_instance.model = "gpt-4o-mini"
-        mock_instance.trigger = ("tokens", 200)
-        mock_instance.keep = ("messages", 1)
-        mock_summarization.return_value = mock_instance
-
-        config = {
-            "type": "summarization",
-            "enabled": True,
-            "model": "gpt-4o-mini",
-            "trigger": {
-                "type": "tokens",
-                "value": 200
-            },
-            "keep": {
-                "type": "messages",
-                "value": 1
-            }
-        }
-
-        middleware = MiddlewareResolver.resolve(config)
+        middleware = MiddlewareResolver.resolve(summarization_config)
 
         assert middleware is not None
         # Verify the middleware was created with correct parameters
@@ -46,78 +53,24 @@ class TestMiddlewareResolver:
         assert middleware.trigger == ("tokens", 200)
         assert middleware.keep == ("messages", 1)
 
-    def test_given_disabled_middleware_when_resolve_called_then_returns_none(self):
+    def test_given_disabled_middleware_when_resolve_called_then_returns_none(self, summarization_config):
         """Test that disabled middleware returns None."""
-        from agent.infrastructure.middleware.resolver import MiddlewareResolver
-        import agent.infrastructure.middleware.providers.summarization
-
-        config = {
-            "type": "summarization",
-            "enabled": False,
-            "model": "gpt-4o-mini",
-            "trigger": {
-                "type": "tokens",
-                "value": 200
-            },
-            "keep": {
-                "type": "messages",
-                "value": 1
-            }
-        }
+        config = {**summarization_config, "enabled": False}
 
         middleware = MiddlewareResolver.resolve(config)
 
         assert middleware is None
 
-    def test_given_unknown_type_when_resolve_called_then_raises_value_error(self):
-        """Test that unknown middleware types raise ValueError."""
-        from agent.infrastructure.middleware.resolver import MiddlewareResolver
-
-        config = {
-            "type": "unknown_middleware_type",
-            "enabled": True
-        }
-
-        with pytest.raises(ValueError, match="Unknown middleware type: unknown_middleware_type"):
-            MiddlewareResolver.resolve(config)
-
-    @patch('agent.infrastructure.middleware.providers.summarization.SummarizationMiddleware')
-    def test_given_multiple_configs_when_resolve_all_called_then_returns_all_enabled_middleware(self, mock_summarization):
+    def test_given_multiple_configs_when_resolve_all_called_then_returns_all_enabled_middleware(self, mock_summarization, summarization_config):
         """Test creating multiple middleware instances from list of configs."""
-        from agent.infrastructure.middleware.resolver import MiddlewareResolver
-        import agent.infrastructure.middleware.providers.summarization
-
-        # Setup mock
-        mock_instance = MagicMock()
-        mock_instance.model = "gpt-4o-mini"
-        mock_summarization.return_value = mock_instance
-
         configs = [
+            summarization_config,
             {
-                "type": "summarization",
-                "enabled": True,
-                "model": "gpt-4o-mini",
-                "trigger": {
-                    "type": "tokens",
-                    "value": 200
-                },
-                "keep": {
-                    "type": "messages",
-                    "value": 1
-                }
-            },
-            {
-                "type": "summarization",
+                **summarization_config,
                 "enabled": False,
                 "model": "gpt-4",
-                "trigger": {
-                    "type": "tokens",
-                    "value": 500
-                },
-                "keep": {
-                    "type": "messages",
-                    "value": 5
-                }
+                "trigger": {"type": "tokens", "value": 500},
+                "keep": {"type": "messages", "value": 5},
             }
         ]
 
@@ -135,46 +88,16 @@ class TestMiddlewareResolver:
 
     def test_given_empty_configs_when_resolve_all_called_then_returns_empty_list(self):
         """Test that empty config list returns empty middleware list."""
-        from agent.infrastructure.middleware.resolver import MiddlewareResolver
-
         middleware_list = MiddlewareResolver.resolve_all([])
 
         assert middleware_list == []
 
-    @patch('agent.infrastructure.middleware.providers.summarization.SummarizationMiddleware')
-    def test_given_config_without_enabled_field_when_resolve_called_then_defaults_to_enabled(self, mock_summarization):
+    def test_given_config_without_enabled_field_when_resolve_called_then_defaults_to_enabled(self, mock_summarization, summarization_config):
         """Test that middleware without 'enabled' field defaults to enabled (True)."""
-        from agent.infrastructure.middleware.resolver import MiddlewareResolver
-        import agent.infrastructure.middleware.providers.summarization
-
-        # Setup mock
-        mock_instance = MagicMock()
-        mock_summarization.return_value = mock_instance
-
-        config = {
-            "type": "summarization",
-            "model": "gpt-4o-mini",
-            "trigger": {
-                "type": "tokens",
-                "value": 200
-            },
-            "keep": {
-                "type": "messages",
-                "value": 1
-            }
-        }
+        config = {k: v for k, v in summarization_config.items() if k != "enabled"}
 
         middleware = MiddlewareResolver.resolve(config)
 
         assert middleware is not None
         # Verify the middleware was created (defaults to enabled)
         mock_summarization.assert_called_once()
-
-    def test_given_builder_function_when_register_decorator_called_then_adds_to_registry(self):
-        """Test that the register decorator adds builders to the registry."""
-        from agent.infrastructure.middleware.resolver import MiddlewareResolver
-        import agent.infrastructure.middleware.providers.summarization
-
-        # Verify summarization is registered
-        assert "summarization" in MiddlewareResolver._REGISTRY
-        assert callable(MiddlewareResolver._REGISTRY["summarization"])
@@ -0,0 +1,57 @@
+import importlib
+import inspect
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from agent.infrastructure.checkpointer.resolver import CheckpointerResolver
+from agent.infrastructure.llm.resolver import LLMResolver
+from agent.infrastructure.middleware.resolver import MiddlewareResolver
+from agent.infrastructure.tools.resolver import ToolResolver
+
+
+@pytest.mark.parametrize(
+    "resolver,key,module",
+    [
+        (CheckpointerResolver, "memory", "agent.infrastructure.checkpointer.providers.memory"),
+        (CheckpointerResolver, "sqlite", "agent.infrastructure.checkpointer.providers.sqlite"),
+        (CheckpointerResolver, "postgres", "agent.infrastructure.checkpointer.providers.postgres"),
+        (LLMResolver, "openai", "agent.infrastructure.llm.providers.openai"),
+        (MiddlewareResolver, "summarization", "agent.infrastructure.middleware.providers.summarization"),
+        (ToolResolver, "mcp", "agent.infrastructure.tools.providers.mcp"),
+    ],
+    ids=["memory", "sqlite", "postgres", "openai", "summarization", "mcp"],
+)
+def test_given_unregistered_builtin_type_when_load_builder_called_then_provider_is_registered(resolver, key, module):
+    """Built-in providers are imported lazily on first use and register themselves."""
+    # Keep the package attribute pointing at the original module, since the
+    # re-import below rebinds it and other tests patch through that path
+    package, _, name = module.rpartition(".")
+    original = importlib.import_module(module)
+    with patch.dict(resolver._REGISTRY, clear=True), patch.dict(sys.modules), \
+         patch.object(sys.modules[package], name, original):
+        sys.modules.pop(module)
+
+        builder = resolver._load_builder(key)
+
+        assert module in sys.modules
+        assert resolver._REGISTRY[key] is builder
+        assert callable(builder)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "resolve,kind",
+    [
+        (CheckpointerResolver.resolve, "checkpointer"),
+        (MiddlewareResolver.resolve, "middleware"),
+        (lambda config: ToolResolver.resolve_all([config]), "tool"),
+    ],
+    ids=["checkpointer", "middleware", "tools"],
+)
+async def test_given_unknown_type_when_resolving_then_raises_value_error(resolve, kind):
+    with pytest.raises(ValueError, match=f"Unknown {kind} type: unknown"):
+        result = resolve({"type": "unknown", "enabled": True})
+        if inspect.isawaitable(result):
+            await result
@@ -1,11 +1,46 @@
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, call, patch
+
+from agent.infrastructure.tools.providers.mcp import clear_mcp_cache
+from agent.infrastructure.tools.resolver import ToolResolver
+
+
+@pytest.fixture(scope="module")
+def _mcp_client_patch():
+    """Install the MultiServerMCPClient patch once for the whole module."""
+    with patch("agent.infrastructure.tools.providers.mcp.MultiServerMCPClient") as mock_client:
+        yield mock_client
+
+
+@pytest.fixture
+def mcp_client(_mcp_client_patch):
+    """The shared MultiServerMCPClient mock, reset for each test."""
+    _mcp_client_patch.reset_mock(return_value=True, side_effect=True)
+    return _mcp_client_patch
+
+
+@pytest.fixture
+def mcp_config():
+    """An enabled MCP tool config for a single server."""
+    return {
+        "type": "mcp",
+        "enabled": True,
+        "servers": {"server1": {"command": "test"}}
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_mcp_cache():
+    """Each test starts without tools cached from earlier builds."""
+    clear_mcp_cache()
+    yield
+    clear_mcp_cache()
 
 
 @pytest.mark.asyncio
 async def test_given_no_configs_when_resolve_all_called_then_returns_empty_list():
-    from agent.infrastructure.tools.resolver import ToolResolver
-
     tools = await ToolResolver.resolve_all([])
 
     assert tools == []
@@ -13,96 +48,111 @@ async def test_given_no_configs_when_resolve_all_called_then_returns_empty_list(
 
 @pytest.mark.asyncio
 async def test_given_none_configs_when_resolve_all_called_then_returns_empty_list():
-    from agent.infrastructure.tools.resolver import ToolResolver
-
     tools = await ToolResolver.resolve_all(None)
 
     assert tools == []
 
 
 @pytest.mark.asyncio
-async def test_given_disabled_config_when_resolve_all_called_then_skips_builder():
-    from agent.infrastructure.tools.resolver import ToolResolver
+async def test_given_disabled_config_when_resolve_all_called_then_skips_builder(mcp_client, mcp_config):
+    tools = await ToolResolver.resolve_all([{**mcp_config, "enabled": False}])
 
-    with patch("agent.infrastructure.tools.providers.mcp.MultiServerMCPClient") as MockClient:
-        tools = await ToolResolver.resolve_all([
-            {
-                "type": "mcp",
-                "enabled": False,
-                "servers": {"server1": {"command": "test"}}
-            }
-        ])
+    mcp_client.assert_not_called()
+    assert tools == []
+
+
+@pytest.mark.asyncio
+async def test_given_mcp_config_when_resolve_all_called_then_returns_tools(mcp_client, mcp_config):
+    mock_tools = ["tool1", "tool2"]
+
+    instance = mcp_client.return_value
+    instance.get_tools = AsyncMock(return_value=mock_tools)
 
-        MockClient.assert_not_called()
-        assert tools == []
+    tools = await ToolResolver.resolve_all([mcp_config])
+
+    mcp_client.assert_called_once_with(mcp_config["servers"])
+    assert tools == mock_tools
 
 
 @pytest.mark.asyncio
-async def test_given_mcp_config_when_resolve_all_called_then_returns_tools():
-    from agent.infrastructure.tools.resolver import ToolResolver
+async def test_given_multiple_mcp_servers_when_resolve_all_called_then_uses_one_client_per_server(mcp_client, mcp_config):
+    mock_servers = {
+        "server1": {"command": "one"},
+        "server2": {"command": "two"},
+    }
 
-    mock_servers = {"server1": {"command": "test"}}
-    mock_tools = ["tool1", "tool2"]
+    mcp_client.return_value.get_tools = AsyncMock(side_effect=[["tool1"], ["tool2", "tool3"]])
 
-    with patch("agent.infrastructure.tools.providers.mcp.MultiServerMCPClient") as MockClient:
-        instance = MockClient.return_value
-        instance.get_tools = AsyncMock(return_value=mock_tools)
+    tools = await ToolResolver.resolve_all([{**mcp_config, "servers": mock_servers}])
 
+    assert mcp_client.call_args_list == [
+        call({"server1": {"command": "one"}}),
+        call({"server2": {"command": "two"}}),
+    ]
+    assert tools == ["tool1", "tool2", "tool3"]
+
+
+@pytest.mark.asyncio
+async def test_given_multiple_configs_when_resolve_all_called_then_builds_concurrently_in_order():
+    started = []
+    release = asyncio.Event()
+
+    async def build(config):
+        started.append(config["name"])
+        if len(started) == 2:
+            release.set()
+        # Each builder waits until both have started, so a serial
+        # resolve_all would deadlock here.
+        await asyncio.wait_for(release.wait(), timeout=1)
+        return config["tools"]
+
+    with patch.dict(ToolResolver._REGISTRY, {"fake": build}):
         tools = await ToolResolver.resolve_all([
-            {
-                "type": "mcp",
-                "enabled": True,
-                "servers": mock_servers
-            }
+            {"type": "fake", "name": "a", "tools": ["a1", "a2"]},
+            {"type": "fake", "name": "b", "tools": []},
+            {"type": "fake", "name": "c", "tools": ["c1"]},
         ])
 
-        MockClient.assert_called_once_with(mock_servers)
-        assert tools == mock_tools
+    assert tools == ["a1", "a2", "c1"]
 
 
 @pytest.mark.asyncio
-async def test_given_unknown_config_type_when_resolve_all_called_then_raises_value_error():
-    from agent.infrastructure.tools.resolver import ToolResolver
-
-    with pytest.raises(ValueError, match="Unknown tool type: unknown"):
-        await ToolResolver.resolve_all([
-            {
-                "type": "unknown"
-            }
-        ])
+async def test_given_unknown_type_after_valid_config_when_resolve_all_called_then_no_builder_runs():
+    build = AsyncMock(return_value=["tool"])
 
+    with patch.dict(ToolResolver._REGISTRY, {"fake": build}):
+        with pytest.raises(ValueError, match="Unknown tool type: unknown"):
+            await ToolResolver.resolve_all([{"type": "fake"}, {"type": "unknown"}])
 
-def test_given_bootstrap_registration_when_agent_imported_then_mcp_is_registered():
-    """Verify that the bootstrap registration in agent.agent registers MCP provider."""
-    from agent.infrastructure.tools.resolver import ToolResolver
-    # Importing agent triggers bootstrap registration
-    import agent.core.agent  # noqa: F401
-    
-    # After bootstrap, mcp should be registered
-    assert "mcp" in ToolResolver._REGISTRY
-    assert callable(ToolResolver._REGISTRY["mcp"])
+    build.assert_not_awaited()
 
 
-def test_given_mcp_provider_directly_imported_when_checking_registry_then_mcp_is_registered():
-    """Verify that directly importing the MCP provider registers it in the ToolResolver."""
-    from agent.infrastructure.tools.resolver import ToolResolver
-    import agent.infrastructure.tools.providers.mcp  # noqa: F401
-    
-    assert "mcp" in ToolResolver._REGISTRY
-    assert callable(ToolResolver._REGISTRY["mcp"])
+@pytest.mark.asyncio
+async def test_given_unchanged_servers_when_resolve_all_called_twice_then_reuses_cached_tools(mcp_client, mcp_config):
+    configs = [mcp_config]
+
+    mcp_client.return_value.get_tools = AsyncMock(return_value=["tool1"])
+
+    first = await ToolResolver.resolve_all(configs)
+    second = await ToolResolver.resolve_all(configs)
+    assert mcp_client.call_count == 1
+
+    clear_mcp_cache()
+    await ToolResolver.resolve_all(configs)
+    assert mcp_client.call_count == 2
+
+    assert first == second == ["tool1"]
 
 
 @pytest.mark.asyncio
-async def test_given_unregistered_tool_type_when_resolve_all_called_then_raises_descriptive_error():
-    """Verify that using an unregistered tool type raises an error with the type name."""
-    from agent.infrastructure.tools.resolver import ToolResolver
-    
-    unregistered_type = "nonexistent_tool_type"
-    
-    with pytest.raises(ValueError, match=f"Unknown tool type: {unregistered_type}"):
-        await ToolResolver.resolve_all([
-            {
-                "type": unregistered_type,
-                "enabled": True
-            }
-        ])
+async def test_given_expired_cache_entry_when_resolve_all_called_then_lists_tools_again(mcp_client, mcp_config):
+    mcp_client.return_value.get_tools = AsyncMock(side_effect=[["tool1"], ["tool1", "tool2"]])
+
+    with patch("agent.infrastructure.tools.providers.mcp.time.monotonic", return_value=1000.0):
+        first = await ToolResolver.resolve_all([mcp_config])
+    with patch("agent.infrastructure.tools.providers.mcp.time.monotonic", return_value=1000.0 + 3600):
+        second = await ToolResolver.resolve_all([mcp_config])
+
+    assert mcp_client.call_count == 2
+    assert first == ["tool1"]
+    assert second == ["tool1", "tool2"]
@@ -1,6 +1,15 @@
 """Tests for MCP server implementation."""
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+
+@pytest.fixture(autouse=True)
+def reset_server_state(monkeypatch):
+    """Give each test fresh server globals, restored afterwards."""
+    monkeypatch.setattr("agent.mcp.server._agent", None)
+    monkeypatch.setattr("agent.mcp.server._agent_lock", None)
+    monkeypatch.setattr("agent.mcp.server._instance_id", None)
 
 
 @pytest.mark.asyncio
@@ -8,10 +17,7 @@ async def test_given_agent_not_initialized_when_get_agent_called_then_creates_ag
     """Test that get_agent lazily initializes the agent."""
     from agent.mcp import server
     
-    # Reset global agent state
-    server._agent = None
-    
-    mock_agent = MagicMock()
+    mock_agent = Mock()
     
     with patch("agent.mcp.server.create_agent_from_args", AsyncMock(return_value=mock_agent)):
         agent = await server.get_agent()
@@ -21,12 +27,12 @@ async def test_given_agent_not_initialized_when_get_agent_called_then_creates_ag
 
 
 @pytest.mark.asyncio
-async def test_given_agent_already_initialized_when_get_agent_called_then_returns_cached():
+async def test_given_agent_already_initialized_when_get_agent_called_then_returns_cached(monkeypatch):
     """Test that get_agent returns cached agent on subsequent calls."""
     from agent.mcp import server
     
-    mock_agent = MagicMock()
-    server._agent = mock_agent
+    mock_agent = Mock()
+    monkeypatch.setattr(server, "_agent", mock_agent)
     
     with patch("agent.mcp.server.create_agent_from_args", AsyncMock()) as mock_create:
         agent = await server.get_agent()
@@ -41,11 +47,8 @@ async def test_given_message_when_chat_tool_called_then_invokes_agent_invoke():
     """Test that chat tool properly calls agent.invoke."""
     from agent.mcp import server
     
-    # Reset global state
-    server._agent = None
-    
     # Mock agent
-    mock_agent = MagicMock()
+    mock_agent = Mock()
     mock_agent.invoke = AsyncMock(return_value="This is the agent response")
     
     with patch("agent.mcp.server.create_agent_from_args", AsyncMock(return_value=mock_agent)):
@@ -67,10 +70,7 @@ async def test_given_multiple_calls_when_chat_tool_called_then_uses_same_agent()
     """Test that multiple chat calls use the same agent instance."""
     from agent.mcp import server
     
-    # Reset global state
-    server._agent = None
-    
-    mock_agent = MagicMock()
+    mock_agent = Mock()
     mock_agent.invoke = AsyncMock(side_effect=["Response 1", "Response 2"])
     
     with patch("agent.mcp.server.create_agent_from_args", AsyncMock(return_value=mock_agent)) as mock_create:
@@ -122,3 +122,127 @@ async def test_given_parse_args_when_called_with_postgres_then_parses_correctly(
         assert args.postgres_dsn == "postgresql://localhost/test"
         assert args.agent_name == "test-agent"
         assert args.no_mcp is True
+
+
+def test_given_args_when_registration_worker_runs_then_registers_before_heartbeats():
+    """Test that the background worker registers, then heartbeats with the new id."""
+    from agent.mcp import server
+    
+    args = SimpleNamespace(postgres_dsn="postgresql://localhost/test")
+    
+    with patch("agent.mcp.server.register_agent_instance", AsyncMock(return_value="instance-1")) as mock_register, \
+         patch("agent.mcp.server.heartbeat_worker") as mock_heartbeat:
+        server.registration_worker(args, 30, "http://agent:8000")
+        
+        mock_register.assert_awaited_once_with(args, "http://agent:8000")
+        mock_heartbeat.assert_called_once_with("instance-1", "postgresql://localhost/test", 30)
+        assert server._instance_id == "instance-1"
+
+
+class FakeDatabaseError(Exception):
+    """Stands in for psycopg2.Error, which other test modules replace with a mock."""
+
+
+def test_given_open_connection_when_send_heartbeat_called_then_reuses_it():
+    """Test that heartbeats prepare once and reuse the same connection."""
+    from agent.mcp.server import send_heartbeat
+    
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    
+    with patch("agent.mcp.server.psycopg2") as mock_psycopg2:
+        mock_psycopg2.Error = FakeDatabaseError
+        mock_psycopg2.connect.return_value = conn
+        
+        first = send_heartbeat("instance-1", "postgresql://localhost/test")
+        second = send_heartbeat("instance-1", "postgresql://localhost/test", first)
+        
+        mock_psycopg2.connect.assert_called_once_with("postgresql://localhost/test")
+        assert first is conn and second is conn
+        statements = [c.args[0].split()[0] for c in cursor.execute.call_args_list]
+        assert statements == ["PREPARE", "EXECUTE", "EXECUTE"]
+
+
+def test_given_failing_connection_when_send_heartbeat_called_then_drops_it():
+    """Test that a failed heartbeat closes the connection so the next one reconnects."""
+    from agent.mcp.server import send_heartbeat
+    
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value.execute.side_effect = FakeDatabaseError("connection lost")
+    
+    with patch("agent.mcp.server.psycopg2") as mock_psycopg2:
+        mock_psycopg2.Error = FakeDatabaseError
+        result = send_heartbeat("instance-1", "postgresql://localhost/test", conn)
+    
+    assert result is None
+    conn.close.assert_called_once()
+
+
+def test_given_programming_error_when_send_heartbeat_called_then_propagates():
+    """Test that non-database errors are not swallowed by the heartbeat."""
+    from agent.mcp.server import send_heartbeat
+    
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value.execute.side_effect = TypeError("bad call")
+    
+    with patch("agent.mcp.server.psycopg2") as mock_psycopg2:
+        mock_psycopg2.Error = FakeDatabaseError
+        with pytest.raises(TypeError):
+            send_heartbeat("instance-1", "postgresql://localhost/test", conn)
+
+
+def test_given_stop_requested_when_heartbeat_worker_runs_then_records_shutdown():
+    """Test that a set stop event ends the loop and records stopped_at."""
+    from agent.mcp import server
+    
+    conn = Mock()
+    
+    with patch("agent.mcp.server.send_heartbeat", return_value=conn) as mock_send, \
+         patch("agent.mcp.server.mark_instance_stopped") as mock_stopped, \
+         patch.object(server, "_stop_heartbeat") as mock_stop:
+        mock_stop.wait.return_value = True
+        
+        server.heartbeat_worker("instance-1", "postgresql://localhost/test", 900)
+        
+        mock_send.assert_called_once_with("instance-1", "postgresql://localhost/test")
+        mock_stop.wait.assert_called_once_with(900)
+        mock_stopped.assert_called_once_with("instance-1", "postgresql://localhost/test", conn)
+
+
+def test_given_consecutive_failures_when_heartbeat_delay_computed_then_backs_off_with_cap():
+    """Test exponential retry backoff with jitter, capped at the interval."""
+    from agent.mcp.server import _heartbeat_delay
+    
+    with patch("agent.mcp.server.random.uniform", return_value=0):
+        assert _heartbeat_delay(100, 0) == 100
+        assert _heartbeat_delay(100, 1) == 30
+        assert _heartbeat_delay(100, 2) == 60
+        assert _heartbeat_delay(100, 3) == 100
+        assert _heartbeat_delay(100, 10) == 100
+    
+    assert 27 <= _heartbeat_delay(100, 1) <= 30
+
+
+def test_given_default_interval_when_heartbeats_keep_failing_then_retries_never_exceed_interval():
+    """Test that the default 900s interval retries sooner, growing back to the interval."""
+    from agent.mcp.server import _heartbeat_delay
+    
+    with patch("agent.mcp.server.random.uniform", return_value=0):
+        delays = [_heartbeat_delay(900, failures) for failures in range(8)]
+    
+    assert delays == [900, 30, 60, 120, 240, 480, 900, 900]
+
+
+def test_given_env_changes_between_calls_when_parse_args_called_then_reads_current_env():
+    """Test that the cached parser still picks up env-var defaults per call."""
+    from agent.mcp.server import parse_args
+    
+    with patch("sys.argv", ["server.py"]):
+        with patch.dict("os.environ", {"SOURCE_TYPE": "filesystem", "AGENT_NAME": "first"}):
+            first = parse_args()
+        with patch.dict("os.environ", {"SOURCE_TYPE": "filesystem", "AGENT_NAME": "second"}):
+            second = parse_args()
+    
+    assert first.source_type == "filesystem"
+    assert first.agent_name == "first"
+    assert second.agent_name == "second"
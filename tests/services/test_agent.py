@@ -1,110 +1,94 @@
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, AsyncMock
 from agent.core import AgentFactory
 
-@pytest.mark.asyncio
-async def test_given_config_when_create_called_then_creates_graph(valid_agent_config):
-    with patch("agent.core.agent.LLMResolver") as MockLLMResolver, \
-         patch("agent.core.agent.create_agent") as mock_create_agent, \
-         patch("agent.core.agent.MiddlewareResolver") as MockMiddlewareResolver, \
-         patch("agent.core.agent.ToolResolver") as MockToolResolver, \
-         patch("agent.core.agent.CheckpointerResolver") as MockCheckpointerResolver:
-        
-        mock_llm = MagicMock()
-        MockLLMResolver.resolve.return_value = mock_llm
-        MockMiddlewareResolver.resolve_all.return_value = []
-        MockToolResolver.resolve_all = AsyncMock(return_value=["tool"])
-        mock_checkpointer = MagicMock()
-        MockCheckpointerResolver.resolve.return_value = mock_checkpointer
-        
-        agent = await AgentFactory.create(valid_agent_config)
-        
-        MockLLMResolver.resolve.assert_called_once_with(
-            valid_agent_config.model_name, 
-            valid_agent_config.temperature
+
+@pytest.fixture
+def patched_agent_deps():
+    """Patch AgentFactory's collaborators with minimal default wiring."""
+    with ExitStack() as stack:
+        deps = SimpleNamespace(
+            llm=stack.enter_context(patch("agent.core.agent.LLMResolver")),
+            create_agent=stack.enter_context(patch("agent.core.agent.create_agent")),
+            middleware=stack.enter_context(patch("agent.core.agent.MiddlewareResolver")),
+            tools=stack.enter_context(patch("agent.core.agent.ToolResolver")),
+            checkpointer=stack.enter_context(patch("agent.core.agent.CheckpointerResolver")),
         )
-        mock_create_agent.assert_called_once()
-        MockMiddlewareResolver.resolve_all.assert_called_once_with(valid_agent_config.middleware_configs)
-        MockToolResolver.resolve_all.assert_awaited_once_with(valid_agent_config.tool_configs)
-        MockCheckpointerResolver.resolve.assert_called_once_with(valid_agent_config.checkpointer_config)
-        assert agent.graph is not None
+        deps.middleware.resolve_all.return_value = []
+        deps.tools.resolve_all = AsyncMock(return_value=["tool"])
+        deps.checkpointer.resolve.return_value = Mock()
+        yield deps
+
+
+def astream_of(*items):
+    """Build an astream replacement yielding a chunk per (content, node) pair."""
+    chunks = []
+    for content, node in items:
+        chunks.append((SimpleNamespace(content=content), {"langgraph_node": node}))
+
+    async def async_gen(*args, **kwargs):
+        for item in chunks:
+            yield item
+    return async_gen
+
+
+def stream_of(*texts):
+    """Build an astream replacement yielding one agent-node chunk per text."""
+    return astream_of(*((text, "agent") for text in texts))
+
 
 @pytest.mark.asyncio
-async def test_given_query_when_stream_called_then_yields_response_tokens(valid_agent_config):
+async def test_given_config_when_create_called_then_creates_graph(valid_agent_config, patched_agent_deps):
+    deps = patched_agent_deps
+    
+    agent = await AgentFactory.create(valid_agent_config)
+    
+    deps.llm.resolve.assert_called_once_with(
+        valid_agent_config.model_name, 
+        valid_agent_config.temperature
+    )
+    deps.create_agent.assert_called_once()
+    deps.middleware.resolve_all.assert_called_once_with(valid_agent_config.middleware_configs)
+    deps.tools.resolve_all.assert_awaited_once_with(valid_agent_config.tool_configs)
+    deps.checkpointer.resolve.assert_called_once_with(valid_agent_config.checkpointer_config)
+    assert agent.graph is not None
+
+@pytest.mark.asyncio
+async def test_given_query_when_stream_called_then_yields_response_tokens(valid_agent_config, patched_agent_deps):
     """Test that stream() yields response tokens correctly."""
-    with patch("agent.core.agent.LLMResolver"), \
-         patch("agent.core.agent.create_agent") as mock_create_agent, \
-         patch("agent.core.agent.MiddlewareResolver") as MockMiddlewareResolver, \
-         patch("agent.core.agent.ToolResolver") as MockToolResolver, \
-         patch("agent.core.agent.CheckpointerResolver") as MockCheckpointerResolver:
-        
-        # Setup mocks
-        mock_graph = MagicMock()
-        mock_create_agent.return_value = mock_graph
-        MockMiddlewareResolver.resolve_all.return_value = []
-        MockToolResolver.resolve_all = AsyncMock(return_value=["tool"])
-        MockCheckpointerResolver.resolve.return_value = MagicMock()
-
-        # Create agent
-        agent = await AgentFactory.create(valid_agent_config)
-        
-        # Mock astream to yield tokens
-        async def async_gen(*args, **kwargs):
-            mock_chunk1 = MagicMock()
-            mock_chunk1.content = "Hello"
-            mock_chunk2 = MagicMock()
-            mock_chunk2.content = " World"
-            
-            metadata = {"langgraph_node": "agent"}
-            yield (mock_chunk1, metadata)
-            yield (mock_chunk2, metadata)
-            
-        mock_graph.astream = async_gen
-        
-        # Call stream and collect tokens
-        tokens = []
-        async for token in agent.stream("test query", "thread-123"):
-            tokens.append(token)
-        
-        # Verify tokens
-        assert tokens == ["Hello", " World"]
+    agent = await AgentFactory.create(valid_agent_config)
+    patched_agent_deps.create_agent.return_value.astream = stream_of("Hello", " World")
+    
+    tokens = [token async for token in agent.stream("test query", "thread-123")]
+    
+    assert tokens == ["Hello", " World"]
 
 
 @pytest.mark.asyncio
-async def test_given_query_when_invoke_called_then_returns_complete_response(valid_agent_config):
+async def test_given_query_when_invoke_called_then_returns_complete_response(valid_agent_config, patched_agent_deps):
     """Test that invoke() returns the complete response."""
-    with patch("agent.core.agent.LLMResolver"), \
-         patch("agent.core.agent.create_agent") as mock_create_agent, \
-         patch("agent.core.agent.MiddlewareResolver") as MockMiddlewareResolver, \
-         patch("agent.core.agent.ToolResolver") as MockToolResolver, \
-         patch("agent.core.agent.CheckpointerResolver") as MockCheckpointerResolver:
-        
-        # Setup mocks
-        mock_graph = MagicMock()
-        mock_create_agent.return_value = mock_graph
-        MockMiddlewareResolver.resolve_all.return_value = []
-        MockToolResolver.resolve_all = AsyncMock(return_value=["tool"])
-        MockCheckpointerResolver.resolve.return_value = MagicMock()
-
-        # Create agent
-        agent = await AgentFactory.create(valid_agent_config)
-        
-        # Mock astream
-        async def async_gen(*args, **kwargs):
-            mock_chunk1 = MagicMock()
-            mock_chunk1.content = "Complete"
-            mock_chunk2 = MagicMock()
-            mock_chunk2.content = " response"
-            
-            metadata = {"langgraph_node": "agent"}
-            yield (mock_chunk1, metadata)
-            yield (mock_chunk2, metadata)
-            
-        mock_graph.astream = async_gen
-        
-        # Call invoke
-        response = await agent.invoke("test query", "thread-123")
-        
-        # Verify complete response
-        assert response == "Complete response"
+    agent = await AgentFactory.create(valid_agent_config)
+    patched_agent_deps.create_agent.return_value.astream = stream_of("Complete", " response")
+    
+    response = await agent.invoke("test query", "thread-123")
+    
+    assert response == "Complete response"
+
+
+@pytest.mark.asyncio
+async def test_given_structured_and_summary_chunks_when_stream_called_then_yields_text_only(valid_agent_config):
+    """Test that stream() extracts text items and skips summarization output."""
+    from agent.core.agent import Agent
+
+    mock_graph = Mock()
+    mock_graph.astream = astream_of(
+        ([{"type": "text", "text": "Hi"}, {"type": "image"}, "raw"], "tools"),
+        ("summary", "SummarizationMiddleware.before_model"),
+    )
+    agent = Agent(valid_agent_config, mock_graph)
+
+    tokens = [token async for token in agent.stream("q", "t")]
 
+    assert tokens == ["Hi"]